@@ -1,9 +1,17 @@
 import sqlite3
+import sys
 from datetime import datetime
 from pathlib import Path
 
-# Path to the database
-DB_PATH = Path(__file__).resolve().parent.parent / "MeynYuay" / "Database" / "habits_pandas.db"
+# The shared habitrack package lives in MeynYuay
+MEINYUAY_DIR = Path(__file__).resolve().parent.parent / "MeynYuay"
+sys.path.insert(0, str(MEINYUAY_DIR))
+
+from habitrack.db import init_db
+from habitrack.queries import day_total, logs_for_date
+
+# Upgrade older databases so the log_date queries below can use their index
+init_db()
 
 
 def print_daily_habits(date_str=None):
@@ -23,19 +31,8 @@ def print_daily_habits(date_str=None):
         date_str = datetime.now().strftime("%Y-%m-%d")
     
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-        
         # Query all records for the specified day
-        cur.execute("""
-            SELECT id, name, done, logged_at 
-            FROM habit_logs 
-            WHERE DATE(logged_at) = ?
-            ORDER BY logged_at ASC
-        """, (date_str,))
-        
-        records = cur.fetchall()
-        conn.close()
+        records = logs_for_date(date_str)
         
         # Display results
         print(f"\n{'='*70}")
@@ -77,39 +74,15 @@ def print_daily_habits_summary(date_str=None):
         date_str = datetime.now().strftime("%Y-%m-%d")
     
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-        
-        # Get summary statistics
-        cur.execute("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN done = 1 THEN 1 ELSE 0 END) as completed,
-                SUM(CASE WHEN done = 0 THEN 1 ELSE 0 END) as incomplete
-            FROM habit_logs 
-            WHERE DATE(logged_at) = ?
-        """, (date_str,))
-        
-        result = cur.fetchone()
-        total, completed, incomplete = result
-        
-        # Get completed habits list
-        cur.execute("""
-            SELECT name FROM habit_logs 
-            WHERE DATE(logged_at) = ? AND done = 1
-            ORDER BY logged_at ASC
-        """, (date_str,))
-        completed_habits = [row[0] for row in cur.fetchall()]
-        
-        # Get incomplete habits list
-        cur.execute("""
-            SELECT name FROM habit_logs 
-            WHERE DATE(logged_at) = ? AND done = 0
-            ORDER BY logged_at ASC
-        """, (date_str,))
-        incomplete_habits = [row[0] for row in cur.fetchall()]
-        
-        conn.close()
+        # Get summary statistics from the precomputed daily rollup
+        totals = day_total(date_str)
+        total, completed = (totals.total, totals.completed) if totals else (0, 0)
+        incomplete = total - completed
+        
+        # Split the day's logs into completed and incomplete habits
+        records = logs_for_date(date_str)
+        completed_habits = [record.name for record in records if record.done]
+        incomplete_habits = [record.name for record in records if not record.done]
         
         # Display summary
         print(f"\n{'='*70}")
@@ -2,12 +2,10 @@ import tkinter as TikiTiki
 import tkinter.ttk as ttk
 import tkinter.messagebox as messagebox
 import math
-import pandas as pd
 import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
-import csv
 
 # -------------------- Paths & Configuration --------------------
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -16,21 +14,20 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 MEINYUAY_DIR = PROJECT_ROOT / "MeynYuay"
 
-# Database folder is inside MeynYuay
-DATABASE_DIR = MEINYUAY_DIR / "Database"
-DATABASE_DIR.mkdir(parents=True, exist_ok=True)
-
-# CSV file for habits
-CSV_PATH = DATABASE_DIR / "habits.csv"
-
 # Button images live in MeynYuay / ButtonUI
 BUTTONUI_DIR = MEINYUAY_DIR / "ButtonUI"
 
+# Shared habitrack package lives in MeynYuay
+sys.path.insert(0, str(MEINYUAY_DIR))
+from habitrack.habit_list import HabitList
+from habitrack.shell import create_window, on_show, share, show_screen
+from habitrack.writer import get_writer
+
 # UI constants
 HABITS_PER_PAGE = 5
 
 # -------------------- Tkinter window --------------------
-window = TikiTiki.Tk()
+window = create_window()  # own Tk window, or a frame of the app shell
 window.title("HabiTrack - Habit Tracker App")
 window.geometry("800x900")
 window.resizable(False, False)
@@ -158,7 +155,7 @@ pagination_frame = TikiTiki.Frame(main_frame, bg="#ECF2FA")
 pagination_frame.pack(pady=10)
 
 # -------------------- State --------------------
-habits = []  # list of {"name": ...}
+habits = []  # list of {"name": ..., "done": ...}
 current_page = 0
 total_pages = 1
 delete_mode = False
@@ -166,124 +163,89 @@ delete_mode = False
 
 
 # File Handling Functions
-# -------------------- CSV master/log handling --------------------
-def load_habits_csv():
-    """Load habit list from CSV if exists."""
+# -------------------- Master list handling --------------------
+def load_habits():
+    """Load habit list from the habit_list table."""
     global habits, total_pages, current_page
-    habits = []
-    if CSV_PATH.exists():
-        try:
-            df = pd.read_csv(CSV_PATH, dtype=str, keep_default_na=False)
-            # Expect header 'name' or first column is names
-            if "name" in df.columns:
-                names = df["name"].tolist()
-            else:
-                first_col = df.columns[0]
-                names = df[first_col].tolist()
-            loaded = []
-            for n in names:
-                nm = str(n).strip()
-                if nm:
-                    loaded.append({"name": nm})
-            habits = loaded
-            total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
-            if current_page >= total_pages:
-                current_page = max(0, total_pages - 1)
-            print(f"Loaded {len(habits)} habits from: {CSV_PATH}")
-            return
-        except Exception as e:
-            print("Error loading master CSV:", e)
-
-    # fallback: try legacy 'habits.csv' (if user used old single-file)
-    legacy = DATABASE_DIR / "habits.csv"
-    if legacy.exists():
-        try:
-            df = pd.read_csv(legacy, dtype=str, keep_default_na=False)
-            # try to extract names heuristically
-            if "name" in df.columns:
-                names = df["name"].tolist()
-            elif "date" in df.columns and "name" in df.columns:
-                names = df["name"].unique().tolist()
-            else:
-                first_col = df.columns[0]
-                names = df[first_col].tolist()
-            loaded = []
-            for n in names:
-                nm = str(n).strip()
-                if nm:
-                    loaded.append({"name": nm})
-            habits = loaded
-            total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
-            if current_page >= total_pages:
-                current_page = max(0, total_pages - 1)
-            print(f"Loaded {len(habits)} habits from legacy file: {legacy}")
-            return
-        except Exception as e:
-            print("Error loading legacy CSV:", e)
-
-    # if nothing found, start empty
-    total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
-    print("No master file found; starting with empty habit list.")
-
-def save_habits_csv():
-    """Save full habit list to CSV, overwriting."""
     try:
-        with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["name", "done"])
-            for h in habits:
-                writer.writerow([h["name"], "True" if h.get("done") else "False"])
-        print(f"Habit list saved to {CSV_PATH}")
+        habits = habit_list.load()
+        print(f"Loaded {len(habits)} habits")
     except Exception as e:
-        messagebox.showerror("Error", f"Failed to save habits:\n{e}")
+        print("Error loading habit list:", e)
+        habits = habit_list.habits = []
 
-# -------------------- Render functions --------------------
-def render_habits():
-    for child in habit_list_frame.winfo_children():
-        child.destroy()
+    total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
+    if current_page >= total_pages:
+        current_page = max(0, total_pages - 1)
 
-    start = current_page * HABITS_PER_PAGE
-    end = start + HABITS_PER_PAGE
+# -------------------- Render functions --------------------
+# Row pool: HABITS_PER_PAGE rows are built once and rebound to habit
+# indices by render_habits() instead of being destroyed and recreated.
+row_pool = []
 
-    for local_index, habit in enumerate(habits[start:end]):
-        global_index = start + local_index
+def habit_font_size(name_text):
+    if len(name_text) > 10:
+        return max(20, 30 - (len(name_text) - 20) // 2)
+    return 40
 
+def build_row_pool():
+    for _ in range(HABITS_PER_PAGE):
         row_frame = TikiTiki.Frame(habit_list_frame, bg="#ECF2FA")
-        row_frame.pack(fill="x", pady=8)
         row_frame.grid_columnconfigure(0, weight=0)
         row_frame.grid_columnconfigure(1, weight=1)
 
+        spacer = TikiTiki.Frame(row_frame, width=18, bg="#ECF2FA")
+        spacer.grid(row=0, column=0, padx=(0, 8))
+
+        del_lbl = TikiTiki.Label(row_frame, image=window.delete_img, bg="#ECF2FA", bd=0, cursor="hand2")
+        del_lbl.grid(row=0, column=0, padx=(0, 8))
+        del_lbl.grid_remove()
+        del_lbl.image = window.delete_img
+
+        habit_label = TikiTiki.Label(row_frame, text="", font=("Helvetica", 40), bg="#ECF2FA")
+        habit_label.grid(row=0, column=1, sticky="w")
+
+        row = {"frame": row_frame, "spacer": spacer, "delete": del_lbl, "label": habit_label, "index": None}
+        del_lbl.bind("<Button-1>", lambda event, r=row: ask_delete(r["index"]))
+        row_pool.append(row)
+
+def ask_delete(gi):
+    if gi is None or gi < 0 or gi >= len(habits):
+        return
+    name = habits[gi]["name"]
+    if messagebox.askyesno("Confirm delete", f"Are you sure you want to delete:\n\n{name}"):
+        habit_list.delete(gi)  # one row, committed in the background
+        global total_pages, current_page
+        total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
+        if current_page >= total_pages:
+            current_page = total_pages - 1
+        render_habits()
+
+def render_habits():
+    start = current_page * HABITS_PER_PAGE
+    page = habits[start:start + HABITS_PER_PAGE]
+
+    for local_index, row in enumerate(row_pool):
+        if local_index >= len(page):
+            row["frame"].pack_forget()
+            row["index"] = None
+            continue
+
+        row["index"] = start + local_index
+
         if delete_mode:
-            del_lbl = TikiTiki.Label(row_frame, image=window.delete_img, bg="#ECF2FA", bd=0, cursor="hand2")
-            del_lbl.grid(row=0, column=0, padx=(0, 8))
-            del_lbl.image = window.delete_img
-
-            def ask_delete(event=None, gi=global_index):
-                if gi < 0 or gi >= len(habits):
-                    return
-                name = habits[gi]["name"]
-                if messagebox.askyesno("Confirm delete", f"Are you sure you want to delete:\n\n{name}"):
-                    del habits[gi]
-                    save_habits_csv()
-                    global total_pages, current_page
-                    total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
-                    if current_page >= total_pages:
-                        current_page = total_pages - 1
-                    render_habits()
-
-            del_lbl.bind("<Button-1>", ask_delete)
+            row["spacer"].grid_remove()
+            row["delete"].grid()
         else:
-            spacer = TikiTiki.Frame(row_frame, width=18, bg="#ECF2FA")
-            spacer.grid(row=0, column=0, padx=(0, 8))
+            row["delete"].grid_remove()
+            row["spacer"].grid()
 
-        name_text = habit.get("name", "")
-        if len(name_text) > 10:
-            font_size = max(20, 30 - (len(name_text) - 20) // 2)
-        else:
-            font_size = 40
+        name_text = page[local_index].get("name", "")
+        row["label"].config(text=name_text, font=("Helvetica", habit_font_size(name_text)))
 
-        habit_label = TikiTiki.Label(row_frame, text=name_text, font=("Helvetica", font_size), bg="#ECF2FA")
-        habit_label.grid(row=0, column=1, sticky="w")
+        # visible rows are always a prefix of the pool, so packing keeps order
+        if row["frame"].winfo_manager() != "pack":
+            row["frame"].pack(fill="x", pady=8)
 
     update_page_label()
 
@@ -338,6 +300,8 @@ back_btn = create_ui_button("Back")
 
 # Back behavior (attempt to open Login UI as before)
 def go_back():
+    if show_screen("login"):
+        return
     login_path = SCRIPT_DIR.parent / "LoginUI" / "New folder" / "build" / "Login.py"
     if not login_path.exists():
         messagebox.showerror("Not found", f"Login UI not found at: {login_path}")
@@ -372,9 +336,11 @@ def add_habit():
         if not name:
             messagebox.showwarning("Empty name", "Please enter a habit name.")
             return
-        # append to memory and CSV
-        habits.append({"name": name})
-        save_habits_csv()
+        if habit_list.find(name):
+            messagebox.showwarning("Duplicate", f"'{name}' is already in the list.")
+            return
+        # append to memory and the database
+        habit_list.add(name)
         global total_pages, current_page
         total_pages = math.ceil(len(habits) / HABITS_PER_PAGE)
         current_page = total_pages - 1 if total_pages > 0 else 0
@@ -396,9 +362,9 @@ def toggle_delete_mode():
 
 delete_btn.config(command=toggle_delete_mode)
 
-# -------------------- Record habits (update CSV) --------------------
+# -------------------- Record habits (save list) --------------------
 def record_habits():
-    """Save current habits to CSV, adding new ones and updating existing ones."""
+    """Commit pending edits and merge in any made by another window, by name."""
     if not habits:
         messagebox.showwarning("No habits", "No habits to record.")
         return
@@ -409,40 +375,41 @@ def record_habits():
     if not ok:
         return
 
-    try:
-        # Load existing habits from CSV if it exists
-        existing = {}
-        if CSV_PATH.exists():
-            try:
-                df = pd.read_csv(CSV_PATH, dtype=str, keep_default_na=False)
-                for _, row in df.iterrows():
-                    existing[row.get("name", "")] = row.get("done", "False")
-            except Exception:
-                existing = {}
-
-        # Merge: update with current habits, keep any that aren't in the current list
-        merged = existing.copy()
-        for h in habits:
-            merged[h["name"]] = "True" if h.get("done") else "False"
-
-        # Write back to CSV
-        with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["name", "done"])
-            for name, done_str in merged.items():
-                writer.writerow([name, done_str])
-
-        messagebox.showinfo("Success", f"Recorded {len(habits)} habit(s) to:\n{CSV_PATH}")
-        print(f"Updated habit list: {CSV_PATH}")
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to record habits: {e}")
+    # Only the edited habits are written; edits another process (e.g.
+    # MainUI) made meanwhile are read back into the list
+    def on_done(merged):
+        refresh_habits()
+        messagebox.showinfo("Success", f"Recorded {len(merged)} habit(s).")
+        print(f"Updated habit list ({len(merged)} habits)")
+
+    habit_list.sync(
+        on_done=on_done,
+        on_error=lambda e: messagebox.showerror("Error", f"Failed to record habits: {e}"),
+    )
+    get_writer().watch(window)
 
 record_btn.config(command=record_habits)
 
 # -------------------- Startup: load master and render --------------------
-load_habits_csv()
+# Under the app shell, Habits and MainUI edit the same list
+habit_list = share("habit_list", HabitList())
+habit_list.watch(
+    window,
+    on_error=lambda e: messagebox.showerror("Error", f"Failed to save habit changes:\n{e}"),
+)
+load_habits()
 total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
 update_page_label()
+build_row_pool()
 render_habits()
 
+def refresh_habits():
+    """Redraw when returning to this screen; the shared list may have changed."""
+    global current_page, total_pages
+    total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
+    current_page = min(current_page, total_pages - 1)
+    render_habits()
+
+on_show(refresh_habits)
+
 window.mainloop()
@@ -1,59 +1,43 @@
-import subprocess
 import sys
 from pathlib import Path
 
 # from tkinter import *
 # Explicit imports to satisfy Flake8
-from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
+from tkinter import Canvas, Button, PhotoImage
 
 
 # Compute paths relative to this script's location (works on any device)
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / "assets" / "frame0"
 
+# Shared habitrack package lives in MeynYuay (project root is 3 levels up)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent / "MeynYuay"))
+from habitrack.shell import create_window, run_app, show_screen
+
+## Started directly: run every screen in this one process
+if __name__ == "__main__":
+    run_app("login")
+    sys.exit()
+
 
 ## Ensure asset path is correct
 def relative_to_assets(path: str) -> Path: 
     return ASSETS_PATH / Path(path)
 
+## This module is only built by the app shell (run directly, it starts
+## run_app above), so navigation always stays in-process
 def open_main():
-    window.destroy()         # close login window
-
-    # launch MainUI as a separate process
-    # Compute path relative to this script (project root is 3 levels up: build -> New folder -> LoginUI -> Habit Track)
-    script_dir = Path(__file__).resolve().parent.parent.parent.parent
-    mainui_path = script_dir / "MeynYuay" / "MainUI.py"
-    mainui_cwd = script_dir / "MeynYuay"
-
-    Popen = subprocess.Popen
-    Popen([sys.executable, str(mainui_path)], cwd=str(mainui_cwd))
+    show_screen("main")
 
 
 def open_habit():
-    window.destroy()         # close login window
-
-    #Launch Habits as a separate process
-    # Compute path relative to this script (project root is 3 levels up: build -> New folder -> LoginUI -> Habit Track)
-    script_dir = Path(__file__).resolve().parent.parent.parent.parent
-    habitsui_path = script_dir / "Habits_" / "Habits.py"
-    habitsui_cwd = script_dir / "Habits_"
-
-    Popen = subprocess.Popen
-    Popen([sys.executable, str(habitsui_path)], cwd=str(habitsui_cwd))
+    show_screen("habits")
 
 
 def open_progress():
+    show_screen("progress")
 
-    # Launch ProgressUI as a separate process
-    # Compute path relative to this script (project root is 3 levels up: build -> New folder -> LoginUI -> Habit Track)
-    script_dir = Path(__file__).resolve().parent.parent.parent.parent
-    progress_path = script_dir / "MeynYuay" / "ProgressUI.py"
-    progress_cwd = script_dir / "MeynYuay"
-
-    Popen = subprocess.Popen
-    Popen([sys.executable, str(progress_path)], cwd=str(progress_cwd))
-
-window = Tk()
+window = create_window()  # own Tk window, or a frame of the app shell
 
 window.geometry("600x600")
 window.configure(bg = "#F5F7FA")
@@ -75,6 +59,7 @@ login_img = PhotoImage(
 
 
 login_button = Button(
+    window,
     image=login_img,
     borderwidth=0,
     highlightthickness=0,
@@ -94,6 +79,7 @@ login_button.place(
 habit_img = PhotoImage(
     file=relative_to_assets("button_2.png"))
 habit_btn = Button(
+    window,
     image=habit_img,
     borderwidth=0,
     highlightthickness=0,
@@ -112,6 +98,7 @@ habit_btn.place(
 progress_Img = PhotoImage(
     file=relative_to_assets("button_3.png"))
 progress_btn = Button(
+    window,
     image=progress_Img,
     borderwidth=0,
     highlightthickness=0,
@@ -2,52 +2,33 @@ import tkinter as TikiTiki
 import tkinter.ttk as ttk
 import tkinter.messagebox as messagebox
 import math
-import pandas as pd
-import sqlite3
 import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
 
+from habitrack.db import init_db
+from habitrack.habit_list import HabitList
+from habitrack.shell import create_window, on_show, share, show_screen
+from habitrack.writer import get_writer
 
 
 # First define SCRIPT_DIR
 SCRIPT_DIR = Path(__file__).resolve().parent
 
-# Now create the Database folder path
-DATABASE_DIR = SCRIPT_DIR / "Database"
-DATABASE_DIR.mkdir(exist_ok=True)  # auto-create folder if missing
-
-CSV_PATH = DATABASE_DIR / "habits.csv"
-DB_PATH   = DATABASE_DIR / "habits_pandas.db"
-
-
-## Initialize the SQLite database and create table if not exists
-def init_db():
-    """Create SQLite table to store daily habit progress."""
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS habit_logs (
-            id        INTEGER PRIMARY KEY AUTOINCREMENT,
-            name      TEXT NOT NULL,
-            done      INTEGER NOT NULL,   -- 1 = done, 0 = not done
-            logged_at TEXT NOT NULL       -- ISO datetime string
-        )
-    """)
-    conn.commit()
-    conn.close()
-# call it once at startup
+
+# Create the habit_logs table (and migrate older databases) once at startup
 init_db()
 
 
-window = TikiTiki.Tk()
+# Own Tk window when run directly; a frame of the app shell when hosted
+window = create_window()
 window.title("Habit Tracker Main UI")
 
 HABITS_PER_PAGE = 3
 
-# Habits list (will be loaded from CSV at startup)
-habits = []  # start empty; load_habits_csv() will populate it if CSV exists
+# Habits list (will be loaded from the database at startup)
+habits = []  # start empty; load_habits() will populate it
 
 
 
@@ -68,42 +49,14 @@ BUTTONUI_DIR = SCRIPT_DIR / "ButtonUI"
 
 
 
-## Load habits from CSV file 
-def load_habits_csv():
+## Load habits from the database
+def load_habits():
    
     global habits, total_pages, current_page
 
-    # If file not present, nothing to load
-    if not CSV_PATH.exists():
-        return
-
     try:
-        df = pd.read_csv(CSV_PATH)
-
-        # Basic validation: must have 'name'
-        if "name" not in df.columns:
-            print("habits.csv missing 'name' column — skipping load.")
-            return
-
-        # If position exists, restore original order
-        if "position" in df.columns:
-            df = df.sort_values("position", ignore_index=True)
-
-        # Build the in-memory list: convert done -> bool
-        loaded = []
-        for _, row in df.iterrows():
-            name = row.get("name", "")
-            done_val = row.get("done", 0)
-            # handle strings ("True"/"False") or numeric 0/1 — be permissive
-            done = False
-            if isinstance(done_val, str):
-                done = done_val.strip().lower() in ("1", "true", "yes", "y")
-            else:
-                try:
-                    done = bool(int(done_val))
-                except Exception:
-                    done = False
-            loaded.append({"name": str(name), "done": done})
+        # One indexed read of the habit_list table
+        loaded = habit_list.load()
 
         # Replace the global habits and fix pagination state
         habits = loaded
@@ -112,18 +65,25 @@ def load_habits_csv():
         if current_page >= total_pages:
             current_page = max(0, total_pages - 1)
 
-        print(f"Loaded {len(habits)} habits from {CSV_PATH}")
+        print(f"Loaded {len(habits)} habits")
 
     except Exception as e:
         # show a non-blocking console warning and a user popup
-        print("Error loading habits CSV:", e)
-        messagebox.showerror("Load error", f"Could not load habits from CSV:\n{e}")
+        print("Error loading habits:", e)
+        habits = habit_list.habits = []  # carry on with an empty list
+        messagebox.showerror("Load error", f"Could not load habits:\n{e}")
 
 
 
 
 
-load_habits_csv()
+# Under the app shell, MainUI and Habits edit the same list
+habit_list = share("habit_list", HabitList())
+habit_list.watch(
+    window,
+    on_error=lambda e: messagebox.showerror("Error", f"Failed to save habit changes:\n{e}"),
+)
+load_habits()
 
 
 ## Loading the images for Button UI
@@ -205,104 +165,265 @@ delete_mode = False
 
 #Functions to render habits and pagination
 
+# Row pool: HABITS_PER_PAGE row widgets are built once (build_row_pool) and
+# rebound to habit indices by render_habits, instead of being destroyed and
+# recreated on every page turn, toggle, add or delete.
+row_pool = []
+
+# Scroll view: a virtualized list for large habit catalogs. Only enough rows
+# to fill the viewport (+1) exist; scrolling moves and rebinds them, so the
+# cost of a redraw does not depend on how many habits there are.
+VIRTUAL_ROW_HEIGHT = 100   # px per habit row (checkbox image + padding)
+VIRTUAL_VISIBLE_ROWS = 4   # rows visible in the viewport at once
+view_mode = "pages"        # "pages" or "scroll"
+virtual_pool = []
+
+scroll_frame = TikiTiki.Frame(main_frame, bg="#ECF2FA")  # packed only in scroll view
+scroll_canvas = TikiTiki.Canvas(
+    scroll_frame,
+    bg="#ECF2FA",
+    height=VIRTUAL_ROW_HEIGHT * VIRTUAL_VISIBLE_ROWS,
+    highlightthickness=0,
+    yscrollincrement=VIRTUAL_ROW_HEIGHT // 4
+)
+scroll_bar = ttk.Scrollbar(scroll_frame, orient="vertical", command=scroll_canvas.yview)
+scroll_bar.pack(side="right", fill="y")
+scroll_canvas.pack(side="left", fill="both", expand=True)
+
+def habit_font_size(name_text):
+    """Adjust font size if the habit text is long so it fits the label."""
+    # base size 20, reduce when length exceeds 10 characters
+    if len(name_text) > 10:
+        # decrease by 1 for every 2 extra characters, clamp at 10
+        return max(15, 25 - (len(name_text) - 15) // 2)
+    return 20
+
+def make_habit_row(parent):
+    """Create one reusable habit row (delete icon, name, checkbox) under parent."""
+    row_frame = TikiTiki.Frame(parent, bg="#ECF2FA")
+
+    # grid so we can place delete icon (col 0), label (col1), done-image (col2)
+    row_frame.grid_columnconfigure(1, weight=1)
+    row_frame.grid_columnconfigure(2, weight=0)
+
+    # placeholder to keep alignment when not in delete mode
+    spacer = TikiTiki.Frame(row_frame, width=18, bg="#ECF2FA")
+    spacer.grid(row=0, column=0, padx=(0, 8))
+
+    # In delete mode the delete PNG replaces the spacer (clicking it asks for confirmation)
+    del_lbl = TikiTiki.Label(
+        row_frame,
+        image=window.delete_img,
+        bg="#ECF2FA",
+        bd=0,
+        cursor="hand2"
+    )
+    del_lbl.grid(row=0, column=0, padx=(0, 8))
+    del_lbl.grid_remove()
+    del_lbl.image = window.delete_img  # keep ref
+
+    habit_label = TikiTiki.Label(
+        row_frame,
+        text="",
+        font=("Helvetica", 20),
+        bg="#ECF2FA"
+    )
+    habit_label.grid(row=0, column=1, sticky="w")
+
+    checkbox_label = TikiTiki.Label(
+        row_frame,
+        image=window.unchecked_img,
+        bg="#ECF2FA",
+        bd=0,
+        cursor="hand2"
+    )
+    checkbox_label.grid(row=0, column=2, padx=100)
+
+    row = {
+        "frame": row_frame,
+        "spacer": spacer,
+        "delete": del_lbl,
+        "label": habit_label,
+        "checkbox": checkbox_label,
+        "index": None,  # global habit index currently shown in this row
+    }
+    # Bound once; handlers read the row's current index when clicked
+    del_lbl.bind("<Button-1>", lambda event, r=row: ask_delete(r["index"]))
+    checkbox_label.bind("<Button-1>", lambda event, r=row: toggle(r))
+    return row
+
+def build_row_pool():
+    """Create the reusable row widgets for one page and for the scroll viewport."""
+    for _ in range(HABITS_PER_PAGE):
+        row_pool.append(make_habit_row(habit_list_frame))
+
+    for _ in range(VIRTUAL_VISIBLE_ROWS + 1):
+        row = make_habit_row(scroll_canvas)
+        row["item"] = scroll_canvas.create_window(
+            0, 0, window=row["frame"], anchor="nw",
+            height=VIRTUAL_ROW_HEIGHT, state="hidden"
+        )
+        virtual_pool.append(row)
+
+def bind_row(row, gi):
+    """Show habit gi in a pooled row."""
+    habit = habits[gi]
+    row["index"] = gi
+
+    if delete_mode:
+        row["spacer"].grid_remove()
+        row["delete"].grid()
+    else:
+        row["delete"].grid_remove()
+        row["spacer"].grid()
+
+    name_text = habit.get("name", "")
+    row["label"].config(text=name_text, font=("Helvetica", habit_font_size(name_text)))
+
+    start_img = window.checked_img if habit["done"] else window.unchecked_img
+    row["checkbox"].config(image=start_img)
+    row["checkbox"].image = start_img  # keep ref
+
+def ask_delete(gi):
+    """Ask confirmation, delete habit gi if yes, refresh."""
+    # double-check gi is within range (it might shift if many deletes happen quickly)
+    if gi is None or gi < 0 or gi >= len(habits):
+        return
+    name = habits[gi]["name"]
+    if messagebox.askyesno("Confirm delete", f"Are you sure you want to delete:\n\n{name}"):
+        # remove the habit (one row, committed in the background)
+        habit_list.delete(gi)
+        # recalc pages and clamp current_page
+        global total_pages, current_page
+        total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
+        if current_page >= total_pages:
+            current_page = total_pages - 1
+        render_habits()
+
+def toggle(row):
+    """Flip the done state of the habit shown in row."""
+    # only toggle done when not in delete mode
+    if delete_mode:
+        return
+    gi = row["index"]
+    if gi is None or gi < 0 or gi >= len(habits):
+        return
+    habit_list.set_done(gi, not habits[gi]["done"])
+    new_img = window.checked_img if habits[gi]["done"] else window.unchecked_img
+    row["checkbox"].config(image=new_img)
+    row["checkbox"].image = new_img
+
 def render_habits():
-    """Clear and redraw habit rows for the current page."""
-    # remove old rows
-    for child in habit_list_frame.winfo_children():
-        child.destroy()
+    """Rebind the pooled rows to the habits on the current page (or in view)."""
+    if view_mode == "scroll":
+        render_scroll_view()
+        return
 
     start = current_page * HABITS_PER_PAGE
-    end = start + HABITS_PER_PAGE
-
-    for local_index, habit in enumerate(habits[start:end]):
-        global_index = start + local_index
-
-        row_frame = TikiTiki.Frame(habit_list_frame, bg="#ECF2FA")
-        row_frame.pack(fill="x", pady=8)
-
-        # grid so we can place delete icon (col 0), label (col1), done-image (col2)
-        row_frame.grid_columnconfigure(1, weight=1)
-        row_frame.grid_columnconfigure(2, weight=0)
-
-        # If in delete mode, show the delete PNG on the left (clicking it asks for confirmation)
-        if delete_mode:
-            del_lbl = TikiTiki.Label(
-                row_frame,
-                image=window.delete_img,
-                bg="#ECF2FA",
-                bd=0,
-                cursor="hand2"
-            )
-            del_lbl.grid(row=0, column=0, padx=(0, 8))
-            del_lbl.image = window.delete_img  # keep ref
-
-            # handler: ask confirmation, delete if yes, refresh
-            def ask_delete(event=None, gi=global_index):
-                # double-check gi is within range (it might shift if many deletes happen quickly)
-                if gi < 0 or gi >= len(habits):
-                    return
-                name = habits[gi]["name"]
-                if messagebox.askyesno("Confirm delete", f"Are you sure you want to delete:\n\n{name}"):
-                    # remove the habit
-                    del habits[gi]
-                    # recalc pages and clamp current_page
-                    global total_pages, current_page
-                    total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
-                    if current_page >= total_pages:
-                        current_page = total_pages - 1
-                    render_habits()
-
-            del_lbl.bind("<Button-1>", ask_delete)
+    page_size = max(0, min(HABITS_PER_PAGE, len(habits) - start))
 
-        else:
-            # placeholder to keep alignment when not in delete mode
-            spacer = TikiTiki.Frame(row_frame, width=18, bg="#ECF2FA")
-            spacer.grid(row=0, column=0, padx=(0, 8))
-
-        # Adjust font size if the habit text is long so it fits the label
-        name_text = habit.get("name", "")
-        # base size 20, reduce when length exceeds 10 characters
-        if len(name_text) > 10:
-            # decrease by 1 for every 2 extra characters, clamp at 10
-            font_size = max(15, 25 - (len(name_text) - 15) // 2)
-        else:
-            font_size = 20
+    for local_index, row in enumerate(row_pool):
+        if local_index >= page_size:
+            # fewer habits than rows on this page
+            row["frame"].pack_forget()
+            row["index"] = None
+            continue
 
-        habit_label = TikiTiki.Label(
-            row_frame,
-            text=name_text,
-            font=("Helvetica", font_size),
-            bg="#ECF2FA"
-        )
-        habit_label.grid(row=0, column=1, sticky="w")
+        bind_row(row, start + local_index)
 
-        start_img = window.checked_img if habit["done"] else window.unchecked_img
+        # visible rows are always a prefix of the pool, so packing keeps order
+        if row["frame"].winfo_manager() != "pack":
+            row["frame"].pack(fill="x", pady=8)
 
-        checkbox_label = TikiTiki.Label(
-            row_frame,
-            image=start_img,
-            bg="#ECF2FA",
-            bd=0,
-            cursor="hand2"
-        )
-        checkbox_label.grid(row=0, column=2, padx=100)
-        checkbox_label.image = start_img  # keep ref
-
-        def toggle(event, gi=global_index, lbl=checkbox_label):
-            # only toggle done when not in delete mode
-            if delete_mode:
-                return
-            if gi < 0 or gi >= len(habits):
-                return
-            habits[gi]["done"] = not habits[gi]["done"]
-            new_img = window.checked_img if habits[gi]["done"] else window.unchecked_img
-            lbl.config(image=new_img)
-            lbl.image = new_img
-
-        checkbox_label.bind("<Button-1>", toggle)
+    update_page_label()
+
+def render_scroll_view():
+    """Resize the scroll region for the whole list, then redraw the rows in view."""
+    scroll_canvas.config(scrollregion=(0, 0, 0, len(habits) * VIRTUAL_ROW_HEIGHT))
+    render_visible_rows()
+
+def render_visible_rows():
+    """Move the virtual rows to the habits currently in the viewport."""
+    first = max(0, int(scroll_canvas.canvasy(0)) // VIRTUAL_ROW_HEIGHT)
+
+    for slot, row in enumerate(virtual_pool):
+        gi = first + slot
+        if gi >= len(habits):
+            scroll_canvas.itemconfigure(row["item"], state="hidden")
+            row["index"] = None
+            continue
+        scroll_canvas.coords(row["item"], 0, gi * VIRTUAL_ROW_HEIGHT)
+        scroll_canvas.itemconfigure(row["item"], state="normal")
+        bind_row(row, gi)
 
     update_page_label()
 
+def on_scroll_view_changed(first, last):
+    scroll_bar.set(first, last)
+    render_visible_rows()
+
+def on_scroll_canvas_resize(event):
+    # stretch rows to the viewport width
+    for row in virtual_pool:
+        scroll_canvas.itemconfigure(row["item"], width=event.width)
+
+def on_mouse_wheel(event):
+    if view_mode != "scroll":
+        return
+    if getattr(event, "num", None) == 4 or event.delta > 0:
+        scroll_canvas.yview_scroll(-1, "units")
+    else:
+        scroll_canvas.yview_scroll(1, "units")
+
+WHEEL_EVENTS = (
+    "<MouseWheel>",  # Windows / macOS
+    "<Button-4>",    # X11 scroll up
+    "<Button-5>",    # X11 scroll down
+)
+
+def on_scroll_enter(event):
+    # the rows cover the canvas, so the wheel is bound app-wide, but only
+    # while the pointer is over the list (other screens share this Tk root)
+    for sequence in WHEEL_EVENTS:
+        scroll_canvas.bind_all(sequence, on_mouse_wheel)
+
+def on_scroll_leave(event):
+    # moving onto a row (a child of the canvas) also leaves the canvas
+    under = scroll_canvas.winfo_containing(event.x_root, event.y_root)
+    path = str(scroll_canvas)
+    if under is not None and (str(under) == path or str(under).startswith(path + ".")):
+        return
+    for sequence in WHEEL_EVENTS:
+        scroll_canvas.unbind_all(sequence)
+
+scroll_canvas.config(yscrollcommand=on_scroll_view_changed)
+scroll_canvas.bind("<Configure>", on_scroll_canvas_resize)
+scroll_canvas.bind("<Enter>", on_scroll_enter)
+scroll_canvas.bind("<Leave>", on_scroll_leave)
+
+def toggle_view_mode():
+    """Switch between paged and scrolling (virtualized) habit lists."""
+    global view_mode
+    if view_mode == "pages":
+        view_mode = "scroll"
+        habit_list_frame.pack_forget()
+        left_btn.grid_remove()
+        right_btn.grid_remove()
+        scroll_frame.pack(fill="x", padx=20, pady=10, before=pagination_frame)
+        # open the scroll view where the current page was
+        scroll_canvas.config(scrollregion=(0, 0, 0, len(habits) * VIRTUAL_ROW_HEIGHT))
+        scroll_canvas.yview_moveto(
+            current_page * HABITS_PER_PAGE / max(1, len(habits))
+        )
+    else:
+        view_mode = "pages"
+        scroll_frame.pack_forget()
+        left_btn.grid()
+        right_btn.grid()
+        habit_list_frame.pack(fill="x", padx=20, pady=10, before=pagination_frame)
+    view_btn.config(text="Page view" if view_mode == "scroll" else "Scroll view")
+    render_habits()
+
 # Pagination frame (img – text – img)
 pagination_frame = TikiTiki.Frame(main_frame, bg="#ECF2FA")
 pagination_frame.pack(pady=10)
@@ -334,9 +455,28 @@ right_btn = TikiTiki.Label(
 right_btn.grid(row=0, column=2, padx=5)
 right_btn.image = right_arrow_img
 
+view_btn = TikiTiki.Button(
+    pagination_frame,
+    text="Scroll view",
+    font=("Helvetica", 12),
+    bg="#AFCBFF",
+    fg="#2B4D78",
+    relief="flat",
+    cursor="hand2",
+    command=toggle_view_mode
+)
+view_btn.grid(row=0, column=3, padx=(20, 5))
+
 def update_page_label():
     global total_pages
     total_pages = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
+    if view_mode == "scroll":
+        shown = [row["index"] for row in virtual_pool if row["index"] is not None]
+        if shown:
+            page_label.config(text=f"{shown[0] + 1}-{shown[-1] + 1} of {len(habits)}")
+        else:
+            page_label.config(text=f"0 of {len(habits)}")
+        return
     page_label.config(text=f"{current_page + 1}/{total_pages}")
 
 def go_prev(event=None):
@@ -355,6 +495,7 @@ left_btn.bind("<Button-1>", go_prev)
 right_btn.bind("<Button-1>", go_next)
 
 # Initial draw
+build_row_pool()
 render_habits()
 
 # Buttons
@@ -387,6 +528,8 @@ record_btn = create_ui_button("Record")
 
 # Back button: return to Login UI (launches login script and closes this window)
 def go_back():
+    if show_screen("login"):
+        return
     login_path = SCRIPT_DIR.parent / "LoginUI" / "New folder" / "build" / "Login.py"
     if not login_path.exists():
         messagebox.showerror("Not found", f"Login UI not found at: {login_path}")
@@ -428,8 +571,11 @@ def add_habit():
         if not name:
             messagebox.showwarning("Empty name", "Please enter a habit name.")
             return
+        if habit_list.find(name):
+            messagebox.showwarning("Duplicate", f"'{name}' is already in the list.")
+            return
         # append new habit to the end
-        habits.append({"name": name, "done": done_var.get()})
+        habit_list.add(name, done_var.get())
         # update pagination globals properly
         global total_pages, current_page
         total_pages = math.ceil(len(habits) / HABITS_PER_PAGE)
@@ -437,6 +583,8 @@ def add_habit():
         current_page = total_pages - 1 if total_pages > 0 else 0
         add_win.destroy()
         render_habits()
+        if view_mode == "scroll":
+            scroll_canvas.yview_moveto(1.0)  # new habit is at the bottom
 
     save_btn = TikiTiki.Button(add_win, text="Add Habit", command=save_and_close, width=12)
     save_btn.pack(pady=12)
@@ -461,7 +609,7 @@ def record_habits():
     Show a confirmation dialog with all current habits.
     If confirmed:
       - log each habit (name, done, datetime) into SQLite
-      - overwrite CSV with current habit states
+      - re-read the habit list, picking up edits made in another window
     """
     if not habits:
         messagebox.showwarning("No habits", "No habits to record.")
@@ -479,39 +627,27 @@ def record_habits():
     if not ok:
         return
 
-    # Use one timestamp for this whole "record" action
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    try:
-        # 1) SQLITE Insert Function
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-
-        for habit in habits:
-            cur.execute(
-                ## SQL Insert statement
-                "INSERT INTO habit_logs (name, done, logged_at) VALUES (?, ?, ?)",
-                (habit["name"], int(habit["done"]), now_str)
-            )
-
-        conn.commit()
-        conn.close()
-
-        # 2) Overwrite CSV with current habit list + done status
-        import csv
-        with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["name", "done"])
-            for habit in habits:
-                writer.writerow([habit["name"], habit["done"]])
-
-        messagebox.showinfo(
-            "Success",
-            f"Recorded {len(habits)} habit(s) to CSV and database."
-        )
+    # The writes run on the background writer so the window stays
+    # responsive; results come back to the callbacks on this thread.
+    writer = get_writer()
+
+    # 1) SQLITE: all rows + rollups + streaks in one transaction,
+    #    with one timestamp for this whole "record" action
+    writer.record(
+        habits, datetime.now(),
+        on_done=lambda count: messagebox.showinfo(
+            "Success", f"Recorded {count} habit(s) to the database."
+        ),
+        on_error=lambda e: messagebox.showerror("Error", f"Failed to record habits:\n{e}"),
+    )
 
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to record habits:\n{e}")
+    # 2) The list and done states are already in habit_list; re-read it
+    #    to pick up edits another window made
+    habit_list.sync(
+        on_done=lambda _: refresh_habits(),
+        on_error=lambda e: messagebox.showerror("Error", f"Failed to save habits:\n{e}"),
+    )
+    writer.watch(window)
 
 
 
@@ -528,10 +664,11 @@ def record_habits():
 #     cur = conn.cursor()
 
 #     cur.execute("""
-#         SELECT name, done, logged_at
-#         FROM habit_logs
-#         WHERE date(logged_at) = ?
-#         ORDER BY logged_at
+#         SELECT h.name, l.done, l.logged_at
+#         FROM habit_logs l
+#         JOIN habits h ON h.id = l.habit_id
+#         WHERE l.log_date = ?
+#         ORDER BY l.logged_at
 #     """, (target_date,))
 
 #     rows = cur.fetchall()
@@ -551,4 +688,15 @@ def record_habits():
 
 record_btn.config(command=record_habits)
 
+def refresh_habits():
+    """Redraw when returning to this screen; the shared list may have changed."""
+    global current_page
+    for habit in habits:
+        habit.setdefault("done", False)
+    total = max(1, math.ceil(len(habits) / HABITS_PER_PAGE))
+    current_page = min(current_page, total - 1)
+    render_habits()
+
+on_show(refresh_habits)
+
 window.mainloop()
@@ -1,29 +1,79 @@
 import tkinter as tk
 import tkinter.ttk as ttk
-from datetime import datetime, timedelta
-import sqlite3
+import tkinter.messagebox as messagebox
+from datetime import date, datetime, timedelta
 from pathlib import Path
-import matplotlib.pyplot as plt
 import calendar
+from collections import OrderedDict
+
+from habitrack.db import DB_PATH, connect, init_db
+from habitrack.prefetch import Prefetcher
+from habitrack.queries import (
+    current_streaks, day_totals, habit_month_totals, logs_for_date, month_bounds
+)
+from habitrack.shell import show_screen
 
-# Path to the database
 SCRIPT_DIR = Path(__file__).resolve().parent
-DB_PATH = SCRIPT_DIR / "Database" / "habits_pandas.db"
+
+# Make sure the log_date column and indexes exist before any query runs
+init_db()
 
 
 class ProgressUI:
+    # How many months of query results to keep for back/forth navigation
+    MONTH_CACHE_SIZE = 12
+    # How often (ms) the main loop collects months loaded by the prefetcher
+    PREFETCH_POLL_MS = 50
+    # Window size: the base height plus that of each optional panel shown
+    WINDOW_WIDTH = 900
+    BASE_HEIGHT = 700
+    CHARTS_HEIGHT = 350
+    YEAR_VIEW_HEIGHT = 190
+    # Year heatmap layout (pixels): day squares, gap, room for the labels
+    YEAR_CELL = 12
+    YEAR_GAP = 3
+    YEAR_LEFT = 32
+    YEAR_TOP = 16
+
     ## Constructor for ProgressUI
-    def __init__(self, parent=None, day_click_callback=None):
-        ## Create Toplevel if parent provided, else main Tk window
-        self.window = tk.Toplevel(parent) if parent else tk.Tk() 
+    def __init__(self, parent=None, day_click_callback=None, container=None):
+        ## Build inside container (the app shell's frame) if given,
+        ## else a Toplevel if parent provided, else main Tk window
+        self.hosted = container is not None
+        if self.hosted:
+            self.window = container
+        else:
+            self.window = tk.Toplevel(parent) if parent else tk.Tk()
         self.window.title("Habit Progress - Monthly View")
-        self.window.geometry("900x700")
+        self.window.geometry(f"{self.WINDOW_WIDTH}x{self.BASE_HEIGHT}")
         self.window.resizable(True, True)
         self.window.configure(bg="#ECF2FA")
         
-        # Current month tracking
-        self.current_date = datetime.now()
+        # Current month tracking (always the 1st, so month arithmetic is safe)
+        self.current_date = datetime.now().replace(day=1)
+
+        # (year, month) -> query results, least recently used first.
+        # PRAGMA data_version on a long-lived connection changes whenever
+        # another connection (e.g. MainUI recording) commits to the database.
+        # It must not be the pooled connection, which MainUI also writes with
+        # when both run in the app shell.
+        self.month_cache = OrderedDict()
+        self.version_conn = connect(DB_PATH)
+        self.data_version = None
+
+        # Adjacent months are loaded on a worker thread and staged in the
+        # cache by the main loop. -1 = browsing back in time, +1 = forward.
+        self.nav_direction = -1
+        self.prefetcher = Prefetcher(self.fetch_month_data)
+        self.prefetch_job = None
 
+        # The month being shown is loaded on its own worker too, so the
+        # window stays responsive; pending_key is the month still waiting
+        # for its data (None once it is on screen).
+        self.loader = Prefetcher(self.fetch_month_data, name="habitrack-month-loader")
+        self.load_job = None
+        self.pending_key = None
+        self.window.bind("<Destroy>", self.on_destroy, add="+")
 
         # If provided, it will be invoked instead of the default popup.
         self.day_click_callback = day_click_callback
@@ -89,6 +139,46 @@ class ProgressUI:
         )
         next_btn.pack(side="left", padx=5)
         
+        ## Show/hide the embedded chart panel
+        self.charts_btn = tk.Button(
+            nav_frame,
+            text="Show Charts",
+            command=self.toggle_charts,
+            font=("Helvetica", 10),
+            bg="#AFCBFF",
+            fg="#2B4D78",
+            relief="flat",
+            cursor="hand2"
+        )
+        self.charts_btn.pack(side="left", padx=5)
+
+        ## Show/hide the year heatmap
+        self.year_btn = tk.Button(
+            nav_frame,
+            text="Show Year",
+            command=self.toggle_year_view,
+            font=("Helvetica", 10),
+            bg="#AFCBFF",
+            fg="#2B4D78",
+            relief="flat",
+            cursor="hand2"
+        )
+        self.year_btn.pack(side="left", padx=5)
+
+        ## Back to the menu (only inside the app shell; standalone has its own window)
+        if self.hosted:
+            menu_btn = tk.Button(
+                nav_frame,
+                text="← Menu",
+                command=lambda: show_screen("login"),
+                font=("Helvetica", 10),
+                bg="#AFCBFF",
+                fg="#2B4D78",
+                relief="flat",
+                cursor="hand2"
+            )
+            menu_btn.pack(side="left", padx=5)
+        
         # Separator line below header
         separator = ttk.Separator(self.window, orient="horizontal")
         separator.pack(fill="x", padx=20, pady=(0, 10))
@@ -113,6 +203,7 @@ class ProgressUI:
         # Calendar grid
         self.calendar_frame = tk.Frame(left_frame, bg="white", relief="solid", bd=1)
         self.calendar_frame.pack(fill="both", expand=True)
+        self.build_calendar_grid()
         
         # Right side: Statistics
         right_frame = tk.Frame(content_frame, bg="#ECF2FA")
@@ -129,6 +220,7 @@ class ProgressUI:
         
         self.stats_frame = tk.Frame(right_frame, bg="white", relief="solid", bd=1)
         self.stats_frame.pack(fill="both", expand=True)
+        self.build_stat_boxes()
         
         # Bottom: Habit breakdown
         breakdown_label = tk.Label(
@@ -158,11 +250,164 @@ class ProgressUI:
         )
         self.breakdown_text.pack(fill="both", expand=True)
         scrollbar.config(command=self.breakdown_text.yview)
+        
+        # Chart panel: packed only while visible. The figure and canvas are
+        # created on first show and reused for every month after that.
+        self.chart_frame = tk.Frame(self.window, bg="white", relief="solid", bd=1)
+        self.charts_visible = False
+        self.figure = None
+        self.chart_canvas = None
+        self.chart_data = None  # month data the chart currently shows
+
+        # Year heatmap panel: packed only while visible, drawn once up front
+        self.build_year_view()
     
     
+    def on_destroy(self, event):
+        """Stop the workers and close the data_version connection with the window."""
+        if event.widget is self.window:
+            for job in (self.prefetch_job, self.load_job):
+                if job is not None:
+                    self.window.after_cancel(job)
+            self.prefetcher.close()
+            self.loader.close()
+            self.version_conn.close()
+
+    def read_data_version(self):
+        """PRAGMA data_version of the long-lived version connection."""
+        return self.version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def database_changed(self):
+        """True if another connection committed since the last cache check."""
+        return self.read_data_version() != self.data_version
+
+    def invalidate_stale_cache(self):
+        """Drop every cached month if the database changed since the last check."""
+        version = self.read_data_version()
+        if version != self.data_version:
+            self.month_cache.clear()
+            self.data_version = version
+
+    def month_key(self, delta=0):
+        """Return (year, month) shifted delta months from the current month."""
+        index = self.current_date.year * 12 + self.current_date.month - 1 + delta
+        return index // 12, index % 12 + 1
+
+    def fetch_month_data(self, key):
+        """Run all queries for one (year, month). Touches no widgets, so any thread may call it."""
+        year, month = key
+        logged_dates = self.get_logged_dates(year, month)
+        return {
+            "logged_dates": logged_dates,
+            "monthly_stats": self.calculate_monthly_stats(logged_dates),
+            "habit_stats": self.get_habit_stats(year, month),
+        }
+
+    def store_month(self, key, data):
+        """Put one month's results in the LRU cache."""
+        self.month_cache[key] = data
+        self.month_cache.move_to_end(key)
+        if len(self.month_cache) > self.MONTH_CACHE_SIZE:
+            self.month_cache.popitem(last=False)
+
+    def get_month_data(self):
+        """Return the current month's query results, from the cache when possible."""
+        key = self.month_key()
+        data = self.month_cache.get(key)
+        if data is not None:
+            self.month_cache.move_to_end(key)
+            return data
+
+        data = self.fetch_month_data(key)
+        self.store_month(key, data)
+        return data
+
+    def schedule_prefetch(self):
+        """Queue the months around the current one, next in travel direction first."""
+        ahead = self.nav_direction
+        keys = [self.month_key(ahead), self.month_key(-ahead), self.month_key(2 * ahead)]
+        keys = [key for key in keys if key not in self.month_cache]
+        self.prefetcher.request(keys, tag=self.data_version)
+        if self.prefetch_job is None:
+            self.prefetch_job = self.window.after(self.PREFETCH_POLL_MS, self.poll_prefetch)
+
+    def poll_prefetch(self):
+        """Main thread: stage finished prefetches in the cache."""
+        self.prefetch_job = None
+        for key, version, data, error in self.prefetcher.drain():
+            # Failed (already printed), or loaded before the database
+            # changed -> stale; either way, drop it
+            if error is None and version == self.data_version and key not in self.month_cache:
+                self.store_month(key, data)
+        if not self.prefetcher.idle():
+            self.prefetch_job = self.window.after(self.PREFETCH_POLL_MS, self.poll_prefetch)
+
     ## Load data for the current month using database queries
     def load_monthly_data(self):
-        """Load and display data for the current month."""
+        """Show the current month: at once if cached, else after a background load."""
+        self.invalidate_stale_cache()
+        key = self.month_key()
+        if key in self.month_cache:
+            self.pending_key = None
+            self.show_month_data()
+            return
+
+        # Replaces any month still queued, so only the latest navigation loads
+        self.pending_key = key
+        self.show_loading()
+        self.loader.request([key], tag=self.data_version)
+        if self.load_job is None:
+            self.load_job = self.window.after(self.PREFETCH_POLL_MS, self.poll_month_load)
+
+    def poll_month_load(self):
+        """Main thread: cache finished loads and show the pending month once it is in."""
+        self.load_job = None
+        failed = None   # the pending month's load raised
+        stale = False   # the pending month loaded before the database changed
+        for key, version, data, error in self.loader.drain():
+            if error is not None:
+                if key == self.pending_key:
+                    failed = error
+            elif version != self.data_version:
+                # Loaded before the database changed -> stale, drop it
+                stale = stale or key == self.pending_key
+            elif key not in self.month_cache:
+                # A month the user already navigated away from is cached but not shown
+                self.store_month(key, data)
+
+        # The prefetcher may have delivered the month first
+        if self.pending_key is not None and self.pending_key in self.month_cache:
+            self.pending_key = None
+            self.show_month_data()
+        elif self.pending_key is not None and failed is not None:
+            self.pending_key = None
+            self.show_load_error(failed)
+        elif self.pending_key is not None and stale:
+            # Load it again under the current data version
+            self.loader.request([self.pending_key], tag=self.data_version)
+
+        if self.pending_key is not None or not self.loader.idle():
+            self.load_job = self.window.after(self.PREFETCH_POLL_MS, self.poll_month_load)
+
+    def show_loading(self):
+        """Mark the view as loading; the previous month stays visible until data arrives."""
+        self.month_label.config(text=f"{self.current_date.strftime('%B %Y')} - Loading...")
+        for value_lbl in self.stat_value_labels:
+            value_lbl.config(text="...")
+        self.window.config(cursor="watch")
+
+    def show_load_error(self, error):
+        """Stop showing "Loading..." and say why the month could not be loaded."""
+        self.month_label.config(text=f"{self.current_date.strftime('%B %Y')} - Could not load")
+        for value_lbl in self.stat_value_labels:
+            value_lbl.config(text="-")
+        self.window.config(cursor="")
+        messagebox.showerror("Load error", f"Could not load {self.current_date.strftime('%B %Y')}:\n{error}")
+
+    def show_month_data(self):
+        """Render the current month from the cache."""
+        self.update_month_label()
+        self.window.config(cursor="")
         ## Display the calendar
         self.display_calendar()
         ## Display statistics
@@ -172,16 +417,19 @@ class ProgressUI:
 
         ## Display monthly completion pie chart
         self.display_monthly_pie_chart()
+
+        ## Recolor the year heatmap if the month moved to another year or the data changed
+        self.display_year_heatmap()
+
+        ## Warm the cache for the months the user is likely to open next
+        self.schedule_prefetch()
     
-    def display_calendar(self):
-        """Display calendar with colored days based on habit logging."""
-        # Clear previous calendar
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
-        
-        # Get all logged dates for this month
-        logged_dates = self.get_logged_dates()
-        
+    def build_calendar_grid(self):
+        """Create the weekday header and 6x7 day cells once.
+
+        display_calendar() only reconfigures these widgets, so changing
+        month never destroys or creates labels.
+        """
         # Day names
         days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
         day_frame = tk.Frame(self.calendar_frame, bg="#2B4D78")
@@ -199,54 +447,94 @@ class ProgressUI:
             )
             day_lbl.pack(side="left", fill="both", expand=True)
         
-        # Calendar dates
-        cal = calendar.monthcalendar(self.current_date.year, self.current_date.month)
+        # A month spans at most 6 weeks; unused weeks are hidden per month
+        self.week_frames = []
+        self.day_cells = []
+        self.cell_dates = []
+        self.visible_weeks = 0
         
-        for week in cal:
+        for week_index in range(6):
             week_frame = tk.Frame(self.calendar_frame, bg="#ECF2FA")
-            week_frame.pack(fill="both", expand=True)
+            self.week_frames.append(week_frame)
             
-            for day in week:
+            for day_index in range(7):
+                cell = tk.Label(
+                    week_frame,
+                    text="",
+                    font=("Helvetica", 9),
+                    bg="#ECF2FA",
+                    fg="#2B4D78",
+                    relief="solid",
+                    bd=1,
+                    width=4,
+                    height=3,
+                    wraplength=40
+                )
+                cell.pack(side="left", fill="both", expand=True)
+                # Bound once; the cell's current date is looked up on click
+                cell_index = len(self.day_cells)
+                cell.bind("<Button-1>", lambda e, i=cell_index: self.on_cell_click(i))
+                self.day_cells.append(cell)
+                self.cell_dates.append(None)
+
+    def display_calendar(self):
+        """Display calendar with colored days based on habit logging."""
+        # Get all logged dates for this month
+        logged_dates = self.get_month_data()["logged_dates"]
+        
+        # Calendar dates
+        cal = calendar.monthcalendar(self.current_date.year, self.current_date.month)
+        
+        # Show exactly as many week rows as this month needs
+        if len(cal) != self.visible_weeks:
+            for week_frame in self.week_frames:
+                week_frame.pack_forget()
+            for week_frame in self.week_frames[:len(cal)]:
+                week_frame.pack(fill="both", expand=True)
+            self.visible_weeks = len(cal)
+        
+        for week_index, week in enumerate(cal):
+            for day_index, day in enumerate(week):
+                cell_index = week_index * 7 + day_index
+                cell = self.day_cells[cell_index]
+                
                 if day == 0:
                     # Empty cell for days from other months
-                    cell = tk.Label(week_frame, text="", bg="#ECF2FA", relief="solid", bd=1)
+                    cell.config(text="", bg="#ECF2FA", cursor="")
+                    self.cell_dates[cell_index] = None
+                    continue
+                
+                date_obj = datetime(self.current_date.year, self.current_date.month, day)
+                date_str = date_obj.strftime("%Y-%m-%d")
+                
+                # Check if this day has logged habits
+                if date_str in logged_dates:
+                    completion = logged_dates[date_str]["completion_rate"]
+                    bg_color = self.completion_color(completion)
+                    text = f"{day}\n{completion:.0f}%"
                 else:
-                    date_obj = datetime(self.current_date.year, self.current_date.month, day)
-                    date_str = date_obj.strftime("%Y-%m-%d")
-                    
-                    # Check if this day has logged habits
-                    if date_str in logged_dates:
-                        completion = logged_dates[date_str]["completion_rate"]
-                        # Color based on completion
-                        if completion == 100:
-                            bg_color = "#90EE90"  # Green
-                        elif completion >= 50:
-                            bg_color = "#FFD700"  # Yellow
-                        else:
-                            bg_color = "#FFB6C1"  # Light red
-                        
-                        text = f"{day}\n{completion:.0f}%"
-                    else:
-                        bg_color = "#E0E0E0"  # Gray (no data)
-                        text = str(day)
-                    
-                    cell = tk.Label(
-                        week_frame,
-                        text=text,
-                        font=("Helvetica", 9),
-                        bg=bg_color,
-                        fg="#2B4D78",
-                        relief="solid",
-                        bd=1,
-                        width=4,
-                        height=3,
-                        wraplength=40,
-                        cursor="hand2"
-                    )
-                    # Bind click to this date
-                    cell.bind("<Button-1>", lambda e, ds=date_str: self.handle_day_click(ds))
+                    bg_color = self.completion_color(None)
+                    text = str(day)
                 
-                cell.pack(side="left", fill="both", expand=True)
+                cell.config(text=text, bg=bg_color, cursor="hand2")
+                self.cell_dates[cell_index] = date_str
+
+    @staticmethod
+    def completion_color(completion):
+        """Background for a day by completion %, shared by the calendar and year heatmap."""
+        if completion is None:
+            return "#E0E0E0"  # Gray (no data)
+        if completion == 100:
+            return "#90EE90"  # Green
+        if completion >= 50:
+            return "#FFD700"  # Yellow
+        return "#FFB6C1"  # Light red
+
+    def on_cell_click(self, cell_index):
+        """Forward a click on a calendar cell to handle_day_click with its date."""
+        date_str = self.cell_dates[cell_index]
+        if date_str is not None:
+            self.handle_day_click(date_str)
 
     def handle_day_click(self, date_str: str):
         """Handle click on a calendar day."""
@@ -255,19 +543,7 @@ class ProgressUI:
     def get_logs_for_specific_date(self, date_str: str):
         """Return all logs for a given date (YYYY-MM-DD)."""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-
-            cur.execute("""
-                SELECT id, name, done, logged_at
-                FROM habit_logs
-                WHERE DATE(logged_at) = ?
-                ORDER BY logged_at
-            """, (date_str,))
-
-
-            conn.close()
-            return rows
+            return logs_for_date(date_str)
         except Exception as e:
             print(f"Error querying logs for {date_str}: {e}")
             return []
@@ -305,23 +581,17 @@ class ProgressUI:
 
         txt.config(state="disabled")
     
-    def display_statistics(self):
-        """Display monthly statistics."""
-        # Clear previous stats
-        for widget in self.stats_frame.winfo_children():
-            widget.destroy()
-        
-        stats = self.calculate_monthly_stats()
-        
-        # Create stat boxes
-        stat_data = [
-            ("Total Days\nLogged", str(stats['total_days'])),
-            ("Avg Completion\nRate", f"{stats['avg_completion']:.1f}%"),
-            ("Best Streak", f"{stats['best_streak']} days"),
-            ("Total Habits\nLogged", str(stats['total_logs'])),
+    def build_stat_boxes(self):
+        """Create the four statistic boxes once; display_statistics() fills in values."""
+        titles = [
+            "Total Days\nLogged",
+            "Avg Completion\nRate",
+            "Best Streak",
+            "Total Habits\nLogged",
         ]
+        self.stat_value_labels = []
         
-        for title, value in stat_data:
+        for title in titles:
             stat_box = tk.Frame(self.stats_frame, bg="#F0F0F0", relief="solid", bd=1)
             stat_box.pack(fill="x", padx=10, pady=8)
             
@@ -336,26 +606,42 @@ class ProgressUI:
             
             value_lbl = tk.Label(
                 stat_box,
-                text=value,
+                text="",
                 font=("Helvetica", 18, "bold"),
                 bg="#F0F0F0",
                 fg="#2B4D78"
             )
             value_lbl.pack(anchor="w", padx=10, pady=(2, 5))
+            self.stat_value_labels.append(value_lbl)
+
+    def display_statistics(self):
+        """Display monthly statistics."""
+        stats = self.get_month_data()["monthly_stats"]
+        
+        # Same order as the boxes in build_stat_boxes()
+        values = [
+            str(stats['total_days']),
+            f"{stats['avg_completion']:.1f}%",
+            f"{stats['best_streak']} days",
+            str(stats['total_logs']),
+        ]
+        
+        for value_lbl, value in zip(self.stat_value_labels, values):
+            value_lbl.config(text=value)
     
     def display_habit_breakdown(self):
         """Display completion stats for each habit."""
         self.breakdown_text.config(state="normal")
         self.breakdown_text.delete("1.0", "end")
         
-        habit_stats = self.get_habit_stats()
+        habit_stats = self.get_month_data()["habit_stats"]
         
         if not habit_stats:
             self.breakdown_text.insert("end", "No habits logged this month.")
         else:
             # Header
-            header = f"{'Habit Name':<35} {'Completed':<12} {'Rate':<10}\n"
-            header += "-" * 60 + "\n"
+            header = f"{'Habit Name':<35} {'Completed':<12} {'Rate':<28} {'Best Streak'}\n"
+            header += "-" * 90 + "\n"
             self.breakdown_text.insert("end", header)
             
             # Sort by completion rate descending
@@ -372,49 +658,31 @@ class ProgressUI:
                 filled = int(bar_length * rate / 100)
                 bar = "█" * filled + "░" * (bar_length - filled)
                 
-                line = f"{habit_name:<35} {completed}/{total:<10} {bar} {rate:.1f}%\n"
+                line = f"{habit_name:<35} {completed}/{total:<10} {bar} {rate:5.1f}%  {stats['best_streak']} days\n"
                 self.breakdown_text.insert("end", line)
         
         self.breakdown_text.config(state="disabled")
     
-    def get_logged_dates(self):
-        """Get all dates with logged habits for current month."""
+    def get_logged_dates(self, year=None, month=None):
+        """Get all dates with logged habits for a month (default: current month), from daily_rollup."""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            
-            start_date = datetime(self.current_date.year, self.current_date.month, 1)
-            end_date = start_date + timedelta(days=32)
-            end_date = end_date.replace(day=1) - timedelta(days=1)
-            
-            cur.execute("""
-                SELECT DATE(logged_at) as date,
-                       COUNT(*) as total,
-                       SUM(CASE WHEN done = 1 THEN 1 ELSE 0 END) as completed
-                FROM habit_logs
-                WHERE DATE(logged_at) BETWEEN ? AND ?
-                GROUP BY DATE(logged_at)
-            """, (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")))
-            
-            result = {}
-            for row in cur.fetchall():
-                date_str, total, completed = row
-                completion_rate = (completed / total * 100) if total > 0 else 0
-                result[date_str] = {
+            start, end = month_bounds(year or self.current_date.year, month or self.current_date.month)
+            return {
+                day: {
                     "total": total,
                     "completed": completed,
-                    "completion_rate": completion_rate
+                    "completion_rate": (completed / total * 100) if total > 0 else 0
                 }
-            
-            conn.close()
-            return result
+                for day, total, completed in day_totals(start, end)
+            }
         except Exception as e:
             print(f"Error getting logged dates: {e}")
             return {}
     
-    def calculate_monthly_stats(self):
+    def calculate_monthly_stats(self, logged_dates=None):
         """Calculate monthly statistics."""
-        logged_dates = self.get_logged_dates()
+        if logged_dates is None:
+            logged_dates = self.get_logged_dates()
         
         if not logged_dates:
             return {
@@ -425,24 +693,16 @@ class ProgressUI:
             }
         
         total_days = len(logged_dates)
-        avg_completion = sum(d['completion_rate'] for d in logged_dates.values()) / total_days if total_days > 0 else 0
+        avg_completion = sum(d['completion_rate'] for d in logged_dates.values()) / total_days
         total_logs = sum(d['total'] for d in logged_dates.values())
-        
-        # Calculate best streak
-        dates = sorted(logged_dates.keys())
-        best_streak = 0
-        current_streak = 1
-        
-        for i in range(1, len(dates)):
-            curr = datetime.strptime(dates[i], "%Y-%m-%d")
-            prev = datetime.strptime(dates[i-1], "%Y-%m-%d")
-            if (curr - prev).days == 1:
-                current_streak += 1
-            else:
-                best_streak = max(best_streak, current_streak)
-                current_streak = 1
-        best_streak = max(best_streak, current_streak)
-        
+
+        # Best streak: consecutive days with any log
+        ordinals = sorted(date.fromisoformat(day).toordinal() for day in logged_dates)
+        best_streak = current_streak = 1
+        for prev, curr in zip(ordinals, ordinals[1:]):
+            current_streak = current_streak + 1 if curr - prev == 1 else 1
+            best_streak = max(best_streak, current_streak)
+
         return {
             'total_days': total_days,
             'avg_completion': avg_completion,
@@ -450,101 +710,111 @@ class ProgressUI:
             'total_logs': total_logs
         }
     
-    def get_habit_stats(self):
-        """Get completion stats for each habit this month."""
+    def get_habit_stats(self, year=None, month=None):
+        """Get completion stats (habit_monthly_rollup) and best streak for each habit in a month."""
+        year, month = year or self.current_date.year, month or self.current_date.month
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            
-            start_date = datetime(self.current_date.year, self.current_date.month, 1)
-            end_date = start_date + timedelta(days=32)
-            end_date = end_date.replace(day=1) - timedelta(days=1)
-            
-            cur.execute("""
-                SELECT name,
-                       COUNT(*) as total,
-                       SUM(CASE WHEN done = 1 THEN 1 ELSE 0 END) as completed
-                FROM habit_logs
-                WHERE DATE(logged_at) BETWEEN ? AND ?
-                GROUP BY name
-                ORDER BY name
-            """, (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")))
-            
-            result = {}
-            for row in cur.fetchall():
-                name, total, completed = row
-                completion_rate = (completed / total * 100) if total > 0 else 0
-                result[name] = {
-                    'total': total,
-                    'completed': completed,
-                    'completion_rate': completion_rate
-                }
-            
-            conn.close()
-            return result
+            totals = habit_month_totals(f"{year:04d}-{month:02d}")
         except Exception as e:
             print(f"Error getting habit stats: {e}")
             return {}
+        best_streaks = self.get_best_streaks(*month_bounds(year, month))
+        return {
+            name: {
+                'total': total,
+                'completed': completed,
+                'completion_rate': (completed / total * 100) if total > 0 else 0,
+                'best_streak': best_streaks.get(name, 0)
+            }
+            for name, total, completed in totals
+        }
+
+    def get_best_streaks(self, start, end):
+        """{habit name: longest run of completed days between start and end}, from the completion matrix."""
+        # NumPy is only needed for the streaks, so it loads with the first
+        # month (on the loader thread) instead of before the window appears
+        try:
+            from habitrack.analytics import load_matrix
+            matrix = load_matrix(start, end)
+        except Exception as e:
+            print(f"Error getting habit streaks: {e}")
+            return {}
+        _, best = matrix.streaks()
+        return dict(zip(matrix.names, best.tolist()))
     
     def calculate_habit_streaks(self):
         """Calculate current streak for each habit (consecutive days with completion = 1)."""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            
-            # Get all habits and their logs, ordered by name and date
-            cur.execute("""
-                SELECT DISTINCT name
-                FROM habit_logs
-                ORDER BY name
-            """)
-
-                    
-            habits = [row[0] for row in cur.fetchall()]
-            streaks = {}
-            
-            for habit in habits:
-                # Get all dates this habit was logged and completed, ordered by date
-                cur.execute("""
-                    SELECT DATE(logged_at) as log_date
-                    FROM habit_logs
-                    WHERE name = ? AND done = 1
-                    ORDER BY logged_at DESC
-                """, (habit,))
-                
-                dates = [datetime.strptime(row[0], "%Y-%m-%d").date() for row in cur.fetchall()]
-                
-                if not dates:
-                    streaks[habit] = 0
-                    continue
-                
-                # Calculate current streak (from today backwards)
-                current_streak = 0
-                today = datetime.now().date()
-                expected_date = today
-                
-                for log_date in dates:
-                    if log_date == expected_date:
-                        current_streak += 1
-                        expected_date = expected_date - timedelta(days=1)
-                    else:
-                        break
-                
-                streaks[habit] = current_streak
-            
-            conn.close()
-            return streaks
+            # Read the streak state maintained by record_habits (see habitrack.streaks)
+            return current_streaks()
         except Exception as e:
             print(f"Error calculating habit streaks: {e}")
             return {}
 
     
+    def toggle_charts(self):
+        """Show or hide the chart panel; charts are only drawn while it is shown."""
+        self.charts_visible = not self.charts_visible
+        self.update_geometry()
+        if self.charts_visible:
+            self.chart_frame.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+            self.charts_btn.config(text="Hide Charts")
+            if self.pending_key is None:  # else drawn when the month arrives
+                self.display_monthly_pie_chart()
+        else:
+            self.chart_frame.pack_forget()
+            self.charts_btn.config(text="Show Charts")
+
+    def update_geometry(self):
+        """Size the window for the panels currently shown."""
+        height = self.BASE_HEIGHT
+        if self.charts_visible:
+            height += self.CHARTS_HEIGHT
+        if self.year_visible:
+            height += self.YEAR_VIEW_HEIGHT
+        self.window.geometry(f"{self.WINDOW_WIDTH}x{height}")
+
+    def ensure_chart_canvas(self):
+        """Create the one Figure, its two axes and the Tk canvas on first use."""
+        if self.figure is not None:
+            return
+        # matplotlib takes longer to import than the whole window takes to
+        # appear, so it is only loaded when the chart panel is first shown
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.figure = Figure(figsize=(9, 3.4), dpi=100)
+        self.chart_axes = self.figure.subplots(1, 2)
+        self.chart_canvas = FigureCanvasTkAgg(self.figure, master=self.chart_frame)
+        self.chart_canvas.get_tk_widget().pack(fill="both", expand=True)
+
     def display_monthly_pie_chart(self):
         """Display monthly completion pie chart with habit streaks and completion percentage."""
-        habit_stats = self.get_habit_stats() ## Get habit stats for the month
+        # Lazy: nothing to draw while the panel is hidden
+        if not self.charts_visible:
+            return
+        
+        month_data = self.get_month_data()
+        if month_data is self.chart_data:
+            return  # already showing exactly this data
+        self.chart_data = month_data
+        habit_stats = month_data["habit_stats"] ## Get habit stats for the month
+        
+        self.ensure_chart_canvas()
+        ax1, ax2 = self.chart_axes
+        # Reuse the same axes every month: clearing drops the previous
+        # month's wedges and texts, so memory stays flat across navigations.
+        ax1.clear()
+        ax2.clear()
+        self.figure.suptitle(f"Monthly Habit Progress - {self.current_date.strftime('%B %Y')}", 
+                             fontsize=14, fontweight='bold')
         
         if not habit_stats:
-            print("No habit data for this month.")
+            for ax in (ax1, ax2):
+                ax.axis("off")
+            ax1.text(0.5, 0.5, "No habit data for this month.", ha="center", va="center",
+                     fontsize=11, color="#2B4D78", transform=ax1.transAxes)
+            self.chart_canvas.draw_idle()
             return
         
         # Calculate overall monthly statistics
@@ -552,11 +822,6 @@ class ProgressUI:
         total_logged = sum(stat['total'] for stat in habit_stats.values())
         overall_completion = (total_completed / total_logged * 100) if total_logged > 0 else 0
         
-        # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 7))
-        fig.suptitle(f"Monthly Habit Progress - {self.current_date.strftime('%B %Y')}", 
-                     fontsize=16, fontweight='bold')
-        
         # Left pie chart: Overall completion rate
         completion_labels = [f'Completed\n({total_completed}/{total_logged})', 
                             f'Not Completed\n({total_logged - total_completed}/{total_logged})']
@@ -570,16 +835,16 @@ class ProgressUI:
             autopct='%1.1f%%',
             shadow=True,
             startangle=90,
-            textprops={'fontsize': 11, 'weight': 'bold'}
+            textprops={'fontsize': 9, 'weight': 'bold'}
         )
         
         for autotext in autotexts1:
             autotext.set_color('white')
-            autotext.set_fontsize(10)
+            autotext.set_fontsize(9)
             autotext.set_weight('bold')
         
         ax1.set_title(f"Overall Completion Rate\n{overall_completion:.1f}%", 
-                     fontsize=12, fontweight='bold', pad=15)
+                     fontsize=11, fontweight='bold', pad=10)
         
         # Right pie chart: Per-habit completion breakdown
         habit_names = []
@@ -614,21 +879,170 @@ class ProgressUI:
             autopct='%1.1f%%',
             shadow=True,
             startangle=90,
-            textprops={'fontsize': 9, 'weight': 'bold'}
+            textprops={'fontsize': 8, 'weight': 'bold'}
         )
         
         for autotext in autotexts2:
             autotext.set_color('white')
-            autotext.set_fontsize(9)
+            autotext.set_fontsize(8)
             autotext.set_weight('bold')
         
-        ax2.set_title("Per-Habit Completion", fontsize=12, fontweight='bold', pad=15)
+        ax2.set_title("Per-Habit Completion", fontsize=11, fontweight='bold', pad=10)
         
-        plt.tight_layout()
-        plt.show()
+        self.figure.tight_layout()
+        self.chart_canvas.draw_idle()
     
+    def build_year_view(self):
+        """Create the year panel: one Canvas holding a square for every day of any year.
+
+        The squares (54 week columns x 7 weekdays) and labels are created
+        once; display_year_heatmap() only recolors and shows/hides them,
+        so a whole year is redrawn in a single pass.
+        """
+        self.year_frame = tk.Frame(self.window, bg="white", relief="solid", bd=1)
+        self.year_visible = False
+        self.year_shown = None      # (year, data_version) currently drawn
+        self.year_rates = {}        # 'YYYY-MM-DD' -> completion % for that year
+        self.year_summary = ""
+        self.year_cell_dates = {}   # canvas item -> 'YYYY-MM-DD'
+
+        header = tk.Frame(self.year_frame, bg="white")
+        header.pack(fill="x", padx=10, pady=(6, 0))
+        self.year_title = tk.Label(
+            header, text="", font=("Helvetica", 12, "bold"), bg="white", fg="#2B4D78"
+        )
+        self.year_title.pack(side="left")
+        self.year_info = tk.Label(header, text="", font=("Helvetica", 10), bg="white", fg="#666666")
+        self.year_info.pack(side="right")
+
+        step = self.YEAR_CELL + self.YEAR_GAP
+        canvas = self.year_canvas = tk.Canvas(
+            self.year_frame,
+            width=self.YEAR_LEFT + 54 * step,
+            height=self.YEAR_TOP + 7 * step,
+            bg="white",
+            highlightthickness=0
+        )
+        canvas.pack(padx=10, pady=(4, 10))
+
+        # Weeks start on Monday, as in the month calendar
+        for row in (0, 2, 4, 6):
+            canvas.create_text(
+                self.YEAR_LEFT - 6, self.YEAR_TOP + row * step + self.YEAR_CELL / 2,
+                text=calendar.day_abbr[row], anchor="e", font=("Helvetica", 8), fill="#666666"
+            )
+        # Moved to the first week of their month on each redraw
+        self.year_month_labels = [
+            canvas.create_text(0, self.YEAR_TOP / 2, text=calendar.month_abbr[month],
+                               anchor="w", font=("Helvetica", 8), fill="#666666")
+            for month in range(1, 13)
+        ]
+        # Column-major: item for week column c, weekday r is self.year_cells[c * 7 + r]
+        self.year_cells = []
+        for col in range(54):
+            for row in range(7):
+                x = self.YEAR_LEFT + col * step
+                y = self.YEAR_TOP + row * step
+                self.year_cells.append(canvas.create_rectangle(
+                    x, y, x + self.YEAR_CELL, y + self.YEAR_CELL, outline="", state="hidden"
+                ))
+
+        canvas.bind("<Button-1>", self.on_year_click)
+        canvas.bind("<Motion>", self.on_year_hover)
+        canvas.bind("<Leave>", lambda event: self.year_info.config(text=self.year_summary))
+
+    def toggle_year_view(self):
+        """Show or hide the year heatmap; it is only drawn while shown."""
+        self.year_visible = not self.year_visible
+        self.update_geometry()
+        if self.year_visible:
+            self.year_frame.pack(fill="x", padx=20, pady=(0, 10), after=self.breakdown_frame)
+            self.year_btn.config(text="Hide Year")
+            if self.database_changed():
+                # Reload the shown month too (in the background), so the
+                # heatmap and the calendar agree; it redraws the heatmap
+                self.load_monthly_data()
+            else:
+                self.display_year_heatmap()
+        else:
+            self.year_frame.pack_forget()
+            self.year_btn.config(text="Show Year")
+
+    def get_year_rates(self, year):
+        """Completion % of every logged day in a year: one range read of daily_rollup."""
+        try:
+            return {
+                day: (completed / total * 100) if total > 0 else 0
+                for day, total, completed in day_totals(f"{year}-01-01", f"{year}-12-31")
+            }
+        except Exception as e:
+            print(f"Error getting year data: {e}")
+            return {}
+
+    def display_year_heatmap(self):
+        """Color one square per day of the shown month's year by its completion rate."""
+        if not self.year_visible:
+            return
+        year = self.current_date.year
+        if self.year_shown == (year, self.data_version):
+            return  # already showing exactly this data
+        self.year_shown = (year, self.data_version)
+        self.year_rates = self.get_year_rates(year)
+
+        canvas = self.year_canvas
+        first = date(year, 1, 1)
+        offset = first.weekday()  # empty squares before Jan 1 in the first column
+        days_in_year = 366 if calendar.isleap(year) else 365
+        self.year_cell_dates = {}
+        for index, item in enumerate(self.year_cells):
+            col, row = divmod(index, 7)
+            day_number = col * 7 + row - offset
+            if not 0 <= day_number < days_in_year:
+                canvas.itemconfigure(item, state="hidden")
+                continue
+            date_str = (first + timedelta(days=day_number)).strftime("%Y-%m-%d")
+            canvas.itemconfigure(
+                item, state="normal", fill=self.completion_color(self.year_rates.get(date_str))
+            )
+            self.year_cell_dates[item] = date_str
+
+        step = self.YEAR_CELL + self.YEAR_GAP
+        for month, label in enumerate(self.year_month_labels, start=1):
+            col = ((date(year, month, 1) - first).days + offset) // 7
+            canvas.coords(label, self.YEAR_LEFT + col * step, self.YEAR_TOP / 2)
+
+        self.year_title.config(text=f"Year at a Glance - {year}")
+        if self.year_rates:
+            average = sum(self.year_rates.values()) / len(self.year_rates)
+            self.year_summary = f"{len(self.year_rates)} days logged, {average:.1f}% average"
+        else:
+            self.year_summary = "No habits logged this year."
+        self.year_info.config(text=self.year_summary)
+
+    def year_date_at(self, event):
+        """Date of the day square under the mouse, or None."""
+        item = self.year_canvas.find_withtag("current")
+        return self.year_cell_dates.get(item[0]) if item else None
+
+    def on_year_hover(self, event):
+        """Show the hovered day's completion rate in the panel header."""
+        date_str = self.year_date_at(event)
+        if date_str is None:
+            self.year_info.config(text=self.year_summary)
+        elif date_str in self.year_rates:
+            self.year_info.config(text=f"{date_str}: {self.year_rates[date_str]:.0f}% completed")
+        else:
+            self.year_info.config(text=f"{date_str}: nothing logged")
+
+    def on_year_click(self, event):
+        """Forward a click on a day square to handle_day_click, like the calendar."""
+        date_str = self.year_date_at(event)
+        if date_str is not None:
+            self.handle_day_click(date_str)
+
     def prev_month(self):
         """Navigate to previous month."""
+        self.nav_direction = -1
         self.current_date = self.current_date - timedelta(days=1)
         self.current_date = self.current_date.replace(day=1)
         self.update_month_label()
@@ -639,6 +1053,7 @@ class ProgressUI:
         # Go to next month
         ## Next month logic
         ## If current month is December, increment year and set month to January
+        self.nav_direction = 1
         if self.current_date.month == 12:
             self.current_date = self.current_date.replace(year=self.current_date.year + 1, month=1)
         else:
@@ -0,0 +1 @@
+"""Shared data layer for the HabiTrack screens (MainUI, ProgressUI, Habits, Debugging)."""
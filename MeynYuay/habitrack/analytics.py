@@ -0,0 +1,170 @@
+import numpy as np
+
+from habitrack.db import DB_PATH, get_connection
+from habitrack.streaks import PARAMS_PER_QUERY
+
+
+## Completion-matrix analytics
+# load_matrix() reads every log in a date range with one grouped query and
+# counts them into two habits x days arrays: logs per habit-day (total) and
+# completed logs per habit-day (completed). Everything ProgressUI shows is
+# derived from those with whole-array NumPy operations; no per-row Python.
+# Counting logs (not habit-days) matches daily_rollup/habit_monthly_rollup,
+# so the numbers agree with the rollups when a day was recorded twice.
+
+# One row per day, in the order of idx_habit_logs_date_habit_done, so SQLite
+# reads the covering index without sorting. habit_id * 2 + done packs both
+# into one number per log; the concatenated numbers are parsed by NumPy.
+# The logs stay aggregated in SQLite on purpose: fetching one row per log
+# through sqlite3 (fetchmany, np.fromiter) costs over a second for 3.65M
+# logs, several times the whole query, and the day's numbers are parsed
+# as one text mode np.fromstring() call.
+DAY_LOGS_SQL = """
+    SELECT log_date, group_concat(habit_id * 2 + done)
+    FROM habit_logs
+    WHERE log_date BETWEEN ? AND ?
+    GROUP BY log_date
+"""
+
+
+class CompletionMatrix:
+    """Logs per habit and day over a date range.
+
+    Attributes:
+        names: habit names, one per row, sorted.
+        days: datetime64[D] array, one per column, every day from start to end.
+        total: int array (habits x days), logs recorded.
+        completed: int array (habits x days), logs marked done.
+    """
+
+    def __init__(self, names, days, total, completed):
+        self.names = names
+        self.days = days
+        self.total = total
+        self.completed = completed
+
+    @classmethod
+    def empty(cls, start, end):
+        """A matrix for start..end with no habits."""
+        days = _day_range(start, end)
+        return cls([], days, np.zeros((0, len(days)), np.int64), np.zeros((0, len(days)), np.int64))
+
+    ## Per day
+
+    def day_totals(self):
+        """(total, completed) log counts per day."""
+        return self.total.sum(axis=0), self.completed.sum(axis=0)
+
+    def day_rates(self):
+        """Completion % per day; NaN on days with nothing logged."""
+        return _percent(*self.day_totals()[::-1])
+
+    def logged_days(self):
+        """Boolean mask of days with at least one log."""
+        return self.day_totals()[0] > 0
+
+    def rolling_rate(self, window=7):
+        """Completion % over the window days ending on each day (NaN if none logged).
+
+        The first window - 1 days average over the days available so far.
+        """
+        total, completed = self.day_totals()
+        return _percent(_window_sums(completed, window), _window_sums(total, window))
+
+    ## Per habit
+
+    def habit_totals(self):
+        """(total, completed) log counts per habit."""
+        return self.total.sum(axis=1), self.completed.sum(axis=1)
+
+    def habit_rates(self):
+        """Completion % per habit; NaN for habits with nothing logged."""
+        return _percent(*self.habit_totals()[::-1])
+
+    def streaks(self):
+        """(current, best) streak per habit, in days with a completed log.
+
+        The current streak is the run that ends on the matrix's last day.
+        """
+        return run_lengths(self.completed > 0)
+
+    ## Whole range
+
+    def best_logged_streak(self):
+        """Longest run of consecutive days with any log."""
+        return int(run_lengths(self.logged_days()[np.newaxis, :])[1][0])
+
+
+def run_lengths(mask):
+    """(current, best) runs of True along the last axis of a 2-D boolean array.
+
+    current is the length of the run ending in the last column.
+    """
+    if mask.shape[1] == 0:
+        zeros = np.zeros(mask.shape[0], np.int64)
+        return zeros, zeros
+    # Days counted so far, minus the count at the latest False: the run so far
+    runs = np.cumsum(mask, axis=1, dtype=np.int32)
+    runs -= np.maximum.accumulate(np.where(mask, 0, runs), axis=1)
+    return runs[:, -1], runs.max(axis=1)
+
+
+def load_matrix(start, end, db_path=DB_PATH):
+    """Return the CompletionMatrix for start..end ('YYYY-MM-DD', inclusive)."""
+    conn = get_connection(db_path)
+    rows = conn.execute(DAY_LOGS_SQL, (start, end)).fetchall()
+    days = _day_range(start, end)
+    if not rows:
+        return CompletionMatrix.empty(start, end)
+
+    # One code per log (habit_id * 2 + done), and how many each day has.
+    # The arrays here have one entry per log, so they are kept narrow and
+    # reused in place: fresh multi-MB allocations cost as much as the math.
+    day_index = (np.array([row[0] for row in rows], dtype="datetime64[D]") - days[0]).astype(np.int32)
+    counts = np.fromiter((row[1].count(",") + 1 for row in rows), dtype=np.int64, count=len(rows))
+    habit_ids = np.fromstring(",".join(row[1] for row in rows), dtype=np.int32, sep=",")
+    done = (habit_ids & 1).astype(bool)
+    habit_ids >>= 1
+
+    # Rows: the habits present, sorted by name
+    present = np.flatnonzero(np.bincount(habit_ids))
+    names_by_id = _habit_names(conn, present.tolist())
+    order = sorted(range(len(present)), key=lambda i: names_by_id[int(present[i])])
+    n_habits, n_days = len(present), len(days)
+
+    # Count each log into the flat habits x days arrays: cell = row * n_days + day,
+    # so each habit's days end up contiguous for the per-habit scans
+    row_start = np.zeros(present[-1] + 1, np.int64)
+    row_start[present[order]] = np.arange(n_habits) * n_days
+    cell = row_start[habit_ids]
+    cell += np.repeat(day_index, counts)
+    total = np.bincount(cell, minlength=n_habits * n_days).reshape(n_habits, n_days)
+    completed = np.bincount(cell[done], minlength=n_habits * n_days).reshape(n_habits, n_days)
+    names = [names_by_id[int(present[i])] for i in order]
+    return CompletionMatrix(names, days, total, completed)
+
+
+def _habit_names(conn, habit_ids):
+    """{habits.id: name} for just the given ids."""
+    names = {}
+    for start in range(0, len(habit_ids), PARAMS_PER_QUERY):
+        chunk = habit_ids[start:start + PARAMS_PER_QUERY]
+        names.update(conn.execute(
+            f"SELECT id, name FROM habits WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+        ))
+    return names
+
+
+def _day_range(start, end):
+    return np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+
+
+def _percent(part, whole):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(whole > 0, part / whole * 100, np.nan)
+
+
+def _window_sums(values, window):
+    sums = np.cumsum(values)
+    sums[window:] = sums[window:] - sums[:-window]
+    return sums
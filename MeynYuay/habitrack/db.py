@@ -0,0 +1,294 @@
+import atexit
+import sqlite3
+import threading
+from pathlib import Path
+
+from habitrack.habits_csv import iter_habits
+from habitrack.rollups import add_to_rollups, rebuild_rollups
+from habitrack.streaks import PARAMS_PER_QUERY, rebuild_streaks, update_streaks
+
+# Database lives in MeynYuay/Database
+PACKAGE_DIR = Path(__file__).resolve().parent
+DATABASE_DIR = PACKAGE_DIR.parent / "Database"
+DATABASE_DIR.mkdir(exist_ok=True)  # auto-create folder if missing
+
+DB_PATH = DATABASE_DIR / "habits_pandas.db"
+
+# The habit master list before it moved into the habit_list table
+LEGACY_CSV_NAME = "habits.csv"
+
+# Compiled statements kept per connection (sqlite3's default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+
+## Schema migrations
+# Each step upgrades the database by one version. The version reached is
+# stored in PRAGMA user_version, so old databases are upgraded in place.
+
+def _migrate_log_date(cur):
+    """v1: stored log_date column + covering indexes for date range queries."""
+    columns = {row[1] for row in cur.execute("PRAGMA table_info(habit_logs)")}
+    if "log_date" not in columns:
+        cur.execute("ALTER TABLE habit_logs ADD COLUMN log_date TEXT")
+
+    # Backfill from the ISO timestamp ('YYYY-MM-DD HH:MM:SS')
+    cur.execute("""
+        UPDATE habit_logs
+        SET log_date = DATE(logged_at)
+        WHERE log_date IS NULL
+    """)
+
+    # Calendar / monthly stats: WHERE log_date BETWEEN ? AND ?
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_habit_logs_date_name_done
+        ON habit_logs (log_date, name, done)
+    """)
+    # Per-habit streaks: WHERE name = ? AND done = 1 ORDER BY log_date
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_habit_logs_name_done_date
+        ON habit_logs (name, done, log_date)
+    """)
+
+
+def _migrate_habit_ids(cur):
+    """v2: habits table with integer ids; habit_logs keyed by habit_id."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS habits (
+            id   INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE
+        )
+    """)
+    # One row per distinct name, numbered in the order they were first logged
+    cur.execute("""
+        INSERT OR IGNORE INTO habits (name)
+        SELECT name FROM habit_logs
+        GROUP BY name
+        ORDER BY MIN(id)
+    """)
+
+    # SQLite cannot swap a column in place, so rebuild habit_logs
+    cur.execute("""
+        CREATE TABLE habit_logs_new (
+            id        INTEGER PRIMARY KEY AUTOINCREMENT,
+            habit_id  INTEGER NOT NULL REFERENCES habits(id),
+            done      INTEGER NOT NULL,   -- 1 = done, 0 = not done
+            logged_at TEXT NOT NULL,      -- ISO datetime string
+            log_date  TEXT NOT NULL       -- 'YYYY-MM-DD' part of logged_at
+        )
+    """)
+    cur.execute("""
+        INSERT INTO habit_logs_new (id, habit_id, done, logged_at, log_date)
+        SELECT l.id, h.id, l.done, l.logged_at, l.log_date
+        FROM habit_logs l
+        JOIN habits h ON h.name = l.name
+    """)
+    cur.execute("DROP TABLE habit_logs")
+    cur.execute("ALTER TABLE habit_logs_new RENAME TO habit_logs")
+
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_habit_logs_date_habit_done
+        ON habit_logs (log_date, habit_id, done)
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_habit_logs_habit_done_date
+        ON habit_logs (habit_id, done, log_date)
+    """)
+
+
+def _migrate_rollups(cur):
+    """v3: daily_rollup and habit_monthly_rollup, filled from existing logs."""
+    rebuild_rollups(cur)
+
+
+def _migrate_streaks(cur):
+    """v4: habit_streaks state, computed from existing logs."""
+    rebuild_streaks(cur)
+
+
+def _migrate_habit_list(cur):
+    """v5: habit_list (the master list and its done states), imported from habits.csv."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS habit_list (
+            habit_id INTEGER PRIMARY KEY REFERENCES habits(id),
+            position INTEGER NOT NULL,   -- display order
+            done     INTEGER NOT NULL    -- current done state, logged on Record
+        )
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_habit_list_position
+        ON habit_list (position)
+    """)
+
+    # Until now the list lived in habits.csv next to the database
+    db_file = next(row[2] for row in cur.execute("PRAGMA database_list") if row[1] == "main")
+    if not db_file:
+        return  # in-memory database
+    csv_path = Path(db_file).with_name(LEGACY_CSV_NAME)
+    if not csv_path.exists():
+        return
+    habits = list(iter_habits(csv_path, unique=True))
+    ids = get_habit_ids(cur, [habit["name"] for habit in habits])
+    cur.executemany(
+        "INSERT INTO habit_list (habit_id, position, done) VALUES (?, ?, ?)",
+        [(ids[habit["name"]], position, int(habit["done"]))
+         for position, habit in enumerate(habits, start=1)]
+    )
+
+
+MIGRATIONS = [
+    _migrate_log_date,
+    _migrate_habit_ids,
+    _migrate_rollups,
+    _migrate_streaks,
+    _migrate_habit_list,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def connect(db_path=DB_PATH, **kwargs):
+    """Open a connection in WAL mode.
+
+    WAL lets ProgressUI read while a record is being written, and with
+    synchronous=NORMAL a commit appends to the log without an fsync; a
+    power cut can lose the last commit but never corrupts the database.
+    """
+    conn = sqlite3.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE, **kwargs)
+    conn.execute("PRAGMA journal_mode = WAL")   # stored in the file
+    conn.execute("PRAGMA synchronous = NORMAL")  # per connection
+    return conn
+
+
+## Connection pool
+# One long-lived connection per thread and database file, opened (and its
+# PRAGMAs applied) on first use and closed when the process exits. sqlite3
+# keeps a per-connection cache of compiled statements, so the fixed query
+# strings in habitrack.queries are only prepared once per connection.
+
+_local = threading.local()
+_pool_lock = threading.Lock()
+_pool = []          # every pooled connection, for close_connections()
+_initialized = set()  # database files init_db() has already upgraded
+
+
+def get_connection(db_path=DB_PATH):
+    """Return the calling thread's pooled connection to db_path."""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    key = str(db_path)
+    conn = connections.get(key)
+    if conn is None:
+        init_db(db_path)
+        # Only ever used by this thread; close_connections() may run on another
+        conn = connections[key] = connect(db_path, check_same_thread=False)
+        with _pool_lock:
+            _pool.append(conn)
+    return conn
+
+
+@atexit.register
+def close_connections():
+    """Close every pooled connection (registered to run at exit)."""
+    with _pool_lock:
+        connections, _pool[:] = list(_pool), []
+    for conn in connections:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass  # busy on a daemon thread that is being torn down
+    _local.__dict__.clear()
+
+
+## Initialize the SQLite database and create table if not exists
+def init_db(db_path=DB_PATH):
+    """Create the habit_logs table and upgrade it to the current schema.
+
+    Runs once per database file per process; later calls return at once.
+    """
+    key = str(db_path)
+    if key in _initialized:
+        return
+
+    conn = connect(db_path)
+    try:
+        cur = conn.cursor()
+        cur.execute("BEGIN")
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS habit_logs (
+                id        INTEGER PRIMARY KEY AUTOINCREMENT,
+                name      TEXT NOT NULL,
+                done      INTEGER NOT NULL,   -- 1 = done, 0 = not done
+                logged_at TEXT NOT NULL       -- ISO datetime string
+            )
+        """)
+
+        version = cur.execute("PRAGMA user_version").fetchone()[0]
+        for target, migrate in enumerate(MIGRATIONS, start=1):
+            if version < target:
+                migrate(cur)
+                cur.execute(f"PRAGMA user_version = {target}")
+
+        conn.commit()
+        _initialized.add(key)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def get_habit_id(cur, name):
+    """Return the habits.id for name, creating the habit on first use."""
+    cur.execute("INSERT OR IGNORE INTO habits (name) VALUES (?)", (name,))
+    cur.execute("SELECT id FROM habits WHERE name = ?", (name,))
+    return cur.fetchone()[0]
+
+
+def get_habit_ids(cur, names):
+    """Return {name: habits.id} for names, creating missing habits in one batch."""
+    names = list(dict.fromkeys(names))
+    ids = _select_habit_ids(cur, names)
+    missing = [name for name in names if name not in ids]
+    if missing:
+        # OR IGNORE: another process may have created some of them since the SELECT
+        cur.executemany("INSERT OR IGNORE INTO habits (name) VALUES (?)", [(name,) for name in missing])
+        ids.update(_select_habit_ids(cur, missing))
+    return ids
+
+
+def _select_habit_ids(cur, names):
+    ids = {}
+    for start in range(0, len(names), PARAMS_PER_QUERY):
+        chunk = names[start:start + PARAMS_PER_QUERY]
+        placeholders = ", ".join("?" * len(chunk))
+        cur.execute(f"SELECT name, id FROM habits WHERE name IN ({placeholders})", chunk)
+        ids.update(cur.fetchall())
+    return ids
+
+
+def record_logs(cur, habits, logged_at, log_date):
+    """Log one "Record" action: one habit_logs row per habit, plus rollups and streaks.
+
+    Runs inside the caller's transaction, so the logs and the aggregates
+    derived from them commit (or roll back) together.
+
+    Args:
+        cur: sqlite3 cursor, inside an open transaction.
+        habits: list of {"name": str, "done": bool} dicts.
+        logged_at (str): "YYYY-MM-DD HH:MM:SS" shared by the whole batch.
+        log_date (str): "YYYY-MM-DD" part of logged_at.
+
+    Returns:
+        list: the (habit_id, done) pairs that were inserted.
+    """
+    ids = get_habit_ids(cur, [habit["name"] for habit in habits])
+    entries = [(ids[habit["name"]], bool(habit["done"])) for habit in habits]
+    cur.executemany(
+        "INSERT INTO habit_logs (habit_id, done, logged_at, log_date) VALUES (?, ?, ?, ?)",
+        [(habit_id, int(done), logged_at, log_date) for habit_id, done in entries]
+    )
+    add_to_rollups(cur, log_date, entries)
+    update_streaks(cur, log_date, entries)
+    return entries
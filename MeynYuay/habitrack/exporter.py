@@ -0,0 +1,161 @@
+import argparse
+import csv
+import json
+import os
+from pathlib import Path
+
+from habitrack.db import DB_PATH, get_connection
+
+# Rows fetched (and written) per fetchmany() call
+EXPORT_BATCH = 5000
+
+COLUMNS = ["id", "habit", "done", "logged_at", "log_date"]
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+
+## Streaming export of habit_logs
+# Rows are read with fetchmany() from one cursor and written batch by
+# batch, so memory use does not grow with the number of rows. The output
+# goes to a temp file renamed over the target at the end (as in
+# habitrack.writer.write_csv), so a failed export never leaves half a file.
+#   csv      id,habit,done,logged_at,log_date with a header row
+#   jsonl    one {"id": ..., "habit": ..., ...} object per line
+#   parquet  columnar, one row group per batch (needs pyarrow installed)
+
+EXPORT_SQL = """
+    SELECT l.id, h.name, l.done, l.logged_at, l.log_date
+    FROM habit_logs l
+    JOIN habits h ON h.id = l.habit_id
+    WHERE l.log_date BETWEEN ? AND ?{habit_filter}
+    ORDER BY l.log_date, l.id
+"""
+
+
+def iter_log_batches(start=None, end=None, habits=None, db_path=DB_PATH, batch_size=EXPORT_BATCH):
+    """Yield lists of (id, habit, done, logged_at, log_date) rows, oldest first.
+
+    Args:
+        start, end (str): 'YYYY-MM-DD' bounds, inclusive; None for no bound.
+        habits: habit names to include; None for every habit.
+    """
+    params = [start or "0000-01-01", end or "9999-12-31"]
+    habit_filter = ""
+    if habits is not None:
+        habits = list(habits)
+        habit_filter = f" AND h.name IN ({', '.join('?' * len(habits))})"
+        params += habits
+
+    cur = get_connection(db_path).cursor()
+    cur.arraysize = batch_size
+    cur.execute(EXPORT_SQL.format(habit_filter=habit_filter), params)
+    try:
+        while True:
+            rows = cur.fetchmany()
+            if not rows:
+                break
+            yield [(log_id, name, bool(done), logged_at, log_date)
+                   for log_id, name, done, logged_at, log_date in rows]
+    finally:
+        cur.close()
+
+
+def export_logs(path, start=None, end=None, habits=None, fmt=None,
+                db_path=DB_PATH, batch_size=EXPORT_BATCH):
+    """Write the matching habit_logs rows to path; returns the number of rows.
+
+    fmt is "csv", "jsonl" or "parquet"; by default it follows path's suffix.
+    """
+    path = Path(path)
+    fmt = fmt or FORMATS.get(path.suffix.lower())
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format for {path.name!r}; use one of {sorted(WRITERS)}")
+
+    batches = iter_log_batches(start, end, habits, db_path, batch_size)
+    tmp_path = f"{path}.tmp"
+    try:
+        count = WRITERS[fmt](tmp_path, batches)
+    except BaseException:
+        batches.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return count
+
+
+def _write_csv(path, batches):
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for rows in batches:
+            writer.writerows(rows)
+            count += len(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    return count
+
+
+def _write_jsonl(path, batches):
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for rows in batches:
+            f.writelines(
+                json.dumps(dict(zip(COLUMNS, row)), ensure_ascii=False) + "\n" for row in rows
+            )
+            count += len(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    return count
+
+
+def _write_parquet(path, batches):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow") from None
+
+    schema = pa.schema([
+        ("id", pa.int64()),
+        ("habit", pa.string()),
+        ("done", pa.bool_()),
+        ("logged_at", pa.string()),
+        ("log_date", pa.string()),
+    ])
+    count = 0
+    writer = pq.ParquetWriter(path, schema)
+    try:
+        for rows in batches:
+            columns = zip(*rows)
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            count += len(rows)
+    finally:
+        writer.close()
+    return count
+
+
+WRITERS = {"csv": _write_csv, "jsonl": _write_jsonl, "parquet": _write_parquet}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export habit logs to CSV, JSON Lines or Parquet.")
+    parser.add_argument("path", help="output file; the format follows its suffix (.csv/.jsonl/.parquet)")
+    parser.add_argument("--from", dest="start", help="first day, YYYY-MM-DD (default: earliest)")
+    parser.add_argument("--to", dest="end", help="last day, YYYY-MM-DD (default: latest)")
+    parser.add_argument("--habit", action="append", dest="habits",
+                        help="only this habit (repeat for several)")
+    parser.add_argument("--format", choices=sorted(WRITERS), help="override the suffix")
+    parser.add_argument("--db", default=DB_PATH, help="database file (default: %(default)s)")
+    args = parser.parse_args()
+
+    count = export_logs(args.path, args.start, args.end, args.habits, args.format, args.db)
+    print(f"Exported {count} log row(s) to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+import argparse
+import threading
+from itertools import islice
+
+from habitrack.db import DB_PATH, get_connection, get_habit_id, get_habit_ids
+from habitrack.habits_csv import iter_habits
+from habitrack.writer import get_writer, write_csv
+
+# Habits inserted per executemany() by import_csv()
+IMPORT_CHUNK = 1000
+
+
+## The habit master list, stored in SQLite
+# habit_list holds one row per listed habit: its display position and its
+# current done state (logged to habit_logs on Record). Deleting a habit
+# from the list keeps its habits row, so its history stays. Edits are
+# described as ops keyed by name (see apply_op):
+#   ["add", name, done]    ["delete", name]    ["done", name, done]
+# CSV is only an explicit export/import format (export_csv/import_csv).
+
+HABIT_LIST_SQL = """
+    SELECT h.name, l.done
+    FROM habit_list l
+    JOIN habits h ON h.id = l.habit_id
+    ORDER BY l.position
+"""
+
+ADD_SQL = """
+    INSERT INTO habit_list (habit_id, position, done)
+    VALUES (?, (SELECT COALESCE(MAX(position), 0) + 1 FROM habit_list), ?)
+    ON CONFLICT (habit_id) DO UPDATE SET done = excluded.done
+"""
+
+DELETE_SQL = """
+    DELETE FROM habit_list
+    WHERE habit_id = (SELECT id FROM habits WHERE name = ?)
+"""
+
+SET_DONE_SQL = """
+    UPDATE habit_list SET done = ?
+    WHERE habit_id = (SELECT id FROM habits WHERE name = ?)
+"""
+
+INSERT_SQL = "INSERT INTO habit_list (habit_id, position, done) VALUES (?, ?, ?)"
+
+
+def apply_op(state, op):
+    """Apply one op to a {name: done} dict in place (insertion order = list order)."""
+    kind, name = op[0], op[1]
+    if kind == "add":
+        state[name] = op[2]
+    elif kind == "delete":
+        state.pop(name, None)
+    elif name in state:
+        state[name] = op[2]
+
+
+def read_habit_list(db_path=DB_PATH):
+    """Return the master list as [{"name": str, "done": bool}] in display order."""
+    rows = get_connection(db_path).execute(HABIT_LIST_SQL)
+    return [{"name": name, "done": bool(done)} for name, done in rows]
+
+
+def apply_ops(cur, ops):
+    """Write ops to habit_list inside the caller's transaction."""
+    for op in ops:
+        kind, name = op[0], op[1]
+        if kind == "add":
+            cur.execute(ADD_SQL, (get_habit_id(cur, name), int(op[2])))
+        elif kind == "delete":
+            cur.execute(DELETE_SQL, (name,))
+        else:
+            cur.execute(SET_DONE_SQL, (int(op[2]), name))
+
+
+class HabitList:
+    """The habit master list, indexed by name and kept in habit_list.
+
+    self.habits is the ordered list the screens display and self.by_name
+    maps each name to its dict in that list; both belong to the Tk thread.
+    Edits change one habit and queue one op, which the background writer
+    (habitrack.writer) commits, so no edit waits on the disk. If that
+    commit fails, the ops stay queued for the next edit or sync() to retry
+    and the error goes to the watch() callback. sync() reads the list back,
+    picking up edits another process made, and replays local edits made
+    meanwhile on top.
+    """
+
+    def __init__(self, db_path=DB_PATH, writer=None):
+        self.db_path = db_path
+        self.writer = writer or get_writer()
+
+        # Tk thread
+        self.habits = None           # the list, once load() has run
+        self.by_name = {}
+        self._seq = 0                # ops logged so far
+        self._unsynced = []          # (seq, op) not yet part of a sync() result
+        self._window = None          # set by watch()
+        self._on_error = None
+        self._error_reported = False # a failed commit was reported; cleared on success
+
+        # Handed from the Tk thread to the writer
+        self._pending_lock = threading.Lock()
+        self._pending = []           # (seq, op)
+        self._committed_seq = 0      # last op committed (writer thread)
+
+    def load(self):
+        """Return the habit list, read from the database on the first call.
+
+        Later calls return the same list object.
+        """
+        if self.habits is None:
+            self.habits = read_habit_list(self.db_path)
+            self.by_name = {habit["name"]: habit for habit in self.habits}
+        return self.habits
+
+    def watch(self, window, on_error):
+        """Call on_error(exception) from window's event loop when edits fail to commit.
+
+        It is called once per run of failures: the retries that follow
+        stay quiet until a commit succeeds again.
+        """
+        self._window = window
+        self._on_error = on_error
+
+    def _commit_failed(self, error):
+        if self._on_error is not None and not self._error_reported:
+            self._error_reported = True
+            self._on_error(error)
+
+    ## Edits (Tk thread)
+
+    def find(self, name):
+        """Return the habit dict named name, or None."""
+        return self.by_name.get(name)
+
+    def add(self, name, done=False):
+        """Append a habit; if the name is already listed, only its done flag is set."""
+        habit = self.by_name.get(name)
+        if habit is None:
+            habit = self.by_name[name] = {"name": name, "done": False}
+            self.habits.append(habit)
+        habit["done"] = bool(done)
+        self._log(["add", name, habit["done"]])
+
+    def delete(self, index):
+        habit = self.habits.pop(index)
+        del self.by_name[habit["name"]]
+        self._log(["delete", habit["name"]])
+
+    def set_done(self, index, done):
+        habit = self.habits[index]
+        habit["done"] = bool(done)
+        self._log(["done", habit["name"], habit["done"]])
+
+    def _log(self, op):
+        self._seq += 1
+        self._unsynced.append((self._seq, op))
+        with self._pending_lock:
+            self._pending.append((self._seq, op))
+        self.writer.submit(f"habit_list:{self.db_path}", self._commit_job, on_error=self._commit_failed)
+        if self._window is not None:
+            self.writer.watch(self._window)
+
+    def sync(self, on_done=None, on_error=None):
+        """Commit local edits, re-read the list, and update self.habits.
+
+        Runs as a writer job; self.habits is updated in place on the Tk
+        thread (see Writer.watch) before on_done(habits) is called.
+        """
+        def merge(result):
+            rows, synced_seq = result
+            # Edits made while the job ran are not in rows yet
+            self._unsynced = [(seq, op) for seq, op in self._unsynced if seq > synced_seq]
+            state = {habit["name"]: habit["done"] for habit in rows}
+            for _, op in self._unsynced:
+                apply_op(state, op)
+            self.habits[:] = [{"name": name, "done": done} for name, done in state.items()]
+            self.by_name = {habit["name"]: habit for habit in self.habits}
+            if on_done is not None:
+                on_done(self.habits)
+
+        self.writer.submit(
+            f"habit_list_sync:{self.db_path}", self._sync_job,
+            on_done=merge, on_error=on_error,
+        )
+
+    ## Writer jobs
+
+    def _commit_job(self):
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+        conn = get_connection(self.db_path)
+        try:
+            with conn:
+                apply_ops(conn.cursor(), [op for _, op in pending])
+        except Exception:
+            # Rolled back: queue the ops again, ahead of any newer ones
+            with self._pending_lock:
+                self._pending[:0] = pending
+            raise
+        self._committed_seq = pending[-1][0]
+        self._error_reported = False
+        return len(pending)
+
+    def _sync_job(self):
+        self._commit_job()
+        return read_habit_list(self.db_path), self._committed_seq
+
+
+## CSV export / import
+
+def export_csv(path, db_path=DB_PATH):
+    """Write the master list to a name,done CSV; returns the number of habits.
+
+    Rows are streamed from the cursor, so the list is never held in memory.
+    """
+    rows = get_connection(db_path).execute(HABIT_LIST_SQL)
+    return write_csv(path, ["name", "done"], ((name, bool(done)) for name, done in rows))
+
+
+def import_csv(path, db_path=DB_PATH):
+    """Replace the master list with the habits in a CSV file; returns how many.
+
+    Accepts every format habitrack.habits_csv.iter_habits() reads. The file
+    is streamed in chunks of IMPORT_CHUNK habits inside one transaction,
+    so a failed import leaves the list unchanged. Screens showing the list
+    pick up the change on their next sync().
+    """
+    conn = get_connection(db_path)
+    habits = iter_habits(path, unique=True)
+    count = 0
+    with conn:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM habit_list")
+        while True:
+            chunk = list(islice(habits, IMPORT_CHUNK))
+            if not chunk:
+                break
+            ids = get_habit_ids(cur, [habit["name"] for habit in chunk])
+            cur.executemany(INSERT_SQL, [
+                (ids[habit["name"]], count + position, int(habit["done"]))
+                for position, habit in enumerate(chunk, start=1)
+            ])
+            count += len(chunk)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or import the habit master list as CSV.")
+    parser.add_argument("action", choices=["export", "import"])
+    parser.add_argument("path", help="CSV file to write (export) or read (import)")
+    parser.add_argument("--db", default=DB_PATH, help="database file (default: %(default)s)")
+    args = parser.parse_args()
+
+    if args.action == "export":
+        print(f"Exported {export_csv(args.path, args.db)} habit(s) to {args.path}")
+    else:
+        print(f"Imported {import_csv(args.path, args.db)} habit(s) from {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import csv
+
+# Spellings of "done" found in habits.csv over time: True/False written by
+# the app, 1/0 and 1.0/0.0 by pandas, yes/y by hand edits
+TRUE_VALUES = {"1", "1.0", "true", "yes", "y"}
+
+
+## Streaming habits.csv reader shared by MainUI and Habits
+# The first row is always a header. Formats it accepts:
+#   name,done[,...]        current master list (extra columns ignored)
+#   name,done,position     older master lists; rows come back in position order
+#   <other header>         names are taken from the first column, done = False
+#   name,done,logged_at    old log exports repeating a name per day (unique=True)
+# A UTF-8 BOM (files saved from Excel) is skipped and blank names are dropped.
+
+def parse_done(value):
+    """Return True for the spellings of "done" in TRUE_VALUES, else False."""
+    return value is not None and value.strip().lower() in TRUE_VALUES
+
+
+def iter_habits(path, unique=False):
+    """Yield {"name": str, "done": bool} for each habit in path, lazily.
+
+    Only the current row is held in memory, except in files with a
+    position column: those rows have to be sorted first, so they are
+    kept as (position, line, name, done) tuples until the end of the file.
+
+    Args:
+        path: CSV file to read.
+        unique (bool): skip names already yielded (first occurrence wins),
+            for log exports that repeat each habit once per day.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        header = [column.strip().lower() for column in header]
+        name_col = header.index("name") if "name" in header else 0
+        done_col = header.index("done") if "done" in header else None
+
+        if "position" in header:
+            rows = _by_position(reader, header.index("position"), name_col, done_col)
+        else:
+            rows = _read_rows(reader, name_col, done_col)
+
+        seen = set()
+        for name, done in rows:
+            if unique:
+                if name in seen:
+                    continue
+                seen.add(name)
+            yield {"name": name, "done": done}
+
+
+def _read_rows(reader, name_col, done_col):
+    """Yield (name, done) from csv rows, skipping rows without a name."""
+    for row in reader:
+        if len(row) <= name_col:
+            continue
+        name = row[name_col].strip()
+        if not name:
+            continue
+        done = done_col is not None and len(row) > done_col and parse_done(row[done_col])
+        yield name, done
+
+
+def _by_position(reader, position_col, name_col, done_col):
+    """Yield (name, done) ordered by the position column (missing/bad positions last)."""
+    keyed = []
+    for line, row in enumerate(reader):
+        if len(row) <= name_col or not row[name_col].strip():
+            continue
+        try:
+            position = float(row[position_col])
+        except (IndexError, ValueError):
+            position = float("inf")
+        if position != position:  # NaN, as pandas wrote empty cells
+            position = float("inf")
+        done = done_col is not None and len(row) > done_col and parse_done(row[done_col])
+        keyed.append((position, line, row[name_col].strip(), done))
+    keyed.sort()
+    for _, _, name, done in keyed:
+        yield name, done
+
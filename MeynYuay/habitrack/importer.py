@@ -0,0 +1,200 @@
+import argparse
+import csv
+import json
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import NamedTuple
+
+from habitrack.db import DB_PATH, get_connection, get_habit_ids
+from habitrack.habits_csv import parse_done
+from habitrack.rollups import rebuild_rollups
+from habitrack.streaks import rebuild_streaks
+
+# Records read, inserted and committed per transaction
+IMPORT_CHUNK = 5000
+
+# Accepted column/key names, first match wins
+HABIT_KEYS = ("habit", "name")
+DATE_KEYS = ("date", "logged_at", "log_date")
+
+
+## Bulk import of historical habit logs
+# Input is CSV (with a header row) or JSON Lines, one (habit, date, done)
+# record per row. The date may carry a time ('YYYY-MM-DD HH:MM:SS' or ISO
+# 8601); without one the log is stamped at midnight. Records are streamed
+# in chunks of IMPORT_CHUNK, each inserted and committed in one
+# transaction, so memory stays bounded whatever the file size.
+#
+# A record is skipped when its habit already has a log on that date, in
+# the database or earlier in the file, so re-running an import is safe.
+# Records without a habit or a readable date, and JSON Lines that are not
+# a JSON object, are counted as invalid and skipped. The rollups and
+# streaks are rebuilt once after the last chunk, or after the last
+# committed chunk if the import stops early; running it again finishes it.
+
+class ImportStats(NamedTuple):
+    read: int           # records read from the file
+    imported: int       # inserted into habit_logs
+    duplicates: int     # skipped: habit already logged that day
+    invalid: int        # skipped: missing habit or unreadable date
+    seconds: float
+
+    @property
+    def rate(self):
+        """Records read per second."""
+        return self.read / self.seconds if self.seconds else 0.0
+
+
+STAGE_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS import_stage (
+        habit_id  INTEGER NOT NULL,
+        done      INTEGER NOT NULL,
+        logged_at TEXT NOT NULL,
+        log_date  TEXT NOT NULL,
+        UNIQUE (habit_id, log_date)
+    )
+"""
+
+# (habit_id, done IN (0, 1), log_date) probes idx_habit_logs_habit_done_date twice
+INSERT_NEW_SQL = """
+    INSERT INTO habit_logs (habit_id, done, logged_at, log_date)
+    SELECT s.habit_id, s.done, s.logged_at, s.log_date
+    FROM import_stage s
+    WHERE NOT EXISTS (
+        SELECT 1 FROM habit_logs l
+        WHERE l.habit_id = s.habit_id AND l.done IN (0, 1) AND l.log_date = s.log_date
+    )
+    ORDER BY s.log_date, s.rowid
+"""
+
+
+def read_records(path):
+    """Yield (habit, date string, done) from a CSV or JSON Lines file, lazily.
+
+    Records without a habit or a date are yielded with None in their place.
+    """
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            rows = _json_objects(f)
+        else:
+            rows = csv.DictReader(f)
+        for row in rows:
+            row = {str(key).strip().lower(): value for key, value in row.items()}
+            done = row.get("done")
+            if not isinstance(done, bool):
+                done = parse_done(None if done is None else str(done))
+            yield _first(row, HABIT_KEYS), _first(row, DATE_KEYS), done
+
+
+def _json_objects(lines):
+    """Yield the object on each non-blank line; {} for a line that is not one."""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield row if isinstance(row, dict) else {}
+
+
+def _first(row, keys):
+    """The first non-blank value among keys, as a stripped string, or None."""
+    for key in keys:
+        value = row.get(key)
+        if value is not None and str(value).strip():
+            return str(value).strip()
+    return None
+
+
+def parse_timestamp(value):
+    """Return ('YYYY-MM-DD HH:MM:SS', 'YYYY-MM-DD') for a date or datetime string, or None."""
+    try:
+        stamp = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return stamp.strftime("%Y-%m-%d %H:%M:%S"), stamp.strftime("%Y-%m-%d")
+
+
+def import_logs(path, db_path=DB_PATH, chunk_size=IMPORT_CHUNK, progress=None):
+    """Stream the records in path into habit_logs; returns ImportStats.
+
+    progress, if given, is called with the running ImportStats after each
+    committed chunk.
+    """
+    conn = get_connection(db_path)
+    cur = conn.cursor()
+    cur.execute(STAGE_SQL)
+    records = read_records(path)
+    read = imported = duplicates = invalid = 0
+    start = time.perf_counter()
+
+    try:
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+            rows = []
+            for habit, day, done in chunk:
+                stamp = parse_timestamp(day) if habit and day else None
+                if stamp is None:
+                    invalid += 1
+                else:
+                    rows.append((habit, int(done)) + stamp)
+
+            with conn:
+                ids = get_habit_ids(cur, [row[0] for row in rows])
+                cur.execute("DELETE FROM import_stage")
+                # UNIQUE (habit_id, log_date): the first record of a habit-day wins
+                cur.executemany(
+                    "INSERT OR IGNORE INTO import_stage (habit_id, done, logged_at, log_date) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(ids[habit], done, logged_at, log_date)
+                     for habit, done, logged_at, log_date in rows]
+                )
+                inserted = cur.execute(INSERT_NEW_SQL).rowcount
+
+            read += len(chunk)
+            imported += inserted
+            duplicates += len(rows) - inserted
+            if progress is not None:
+                progress(ImportStats(read, imported, duplicates, invalid, time.perf_counter() - start))
+    finally:
+        # Derived tables once, after the inserts: also when everything was a
+        # duplicate (an interrupted import being re-run) or the import failed
+        # part way, so the rollups match the chunks already committed
+        if read:
+            with conn:
+                rebuild_rollups(cur)
+                rebuild_streaks(cur)
+        cur.execute("DROP TABLE IF EXISTS temp.import_stage")
+    return ImportStats(read, imported, duplicates, invalid, time.perf_counter() - start)
+
+
+def print_progress(stats):
+    print(f"\r{stats.read:>10} read  {stats.imported:>10} imported  "
+          f"{stats.rate:>9.0f} rows/s", end="", file=sys.stderr, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import historical habit logs (habit, date, done) from CSV or JSON Lines."
+    )
+    parser.add_argument("path", help="file to import (.csv, or .jsonl/.ndjson)")
+    parser.add_argument("--db", default=DB_PATH, help="database file (default: %(default)s)")
+    parser.add_argument("--chunk", type=int, default=IMPORT_CHUNK, help="records per transaction")
+    args = parser.parse_args()
+
+    stats = import_logs(args.path, args.db, args.chunk, progress=print_progress)
+    print(file=sys.stderr)
+    print(f"Imported {stats.imported} of {stats.read} record(s) in {stats.seconds:.1f}s "
+          f"({stats.rate:.0f} rows/s); skipped {stats.duplicates} duplicate(s) "
+          f"and {stats.invalid} invalid record(s)")
+
+
+if __name__ == "__main__":
+    main()
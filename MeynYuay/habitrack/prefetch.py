@@ -0,0 +1,79 @@
+import threading
+
+
+class Prefetcher:
+    """Run load(key) for requested keys on a background thread.
+
+    Each request() replaces whatever was still queued, so work for a view
+    the user already left is dropped. Finished results are collected with
+    drain() on the caller's thread; nothing here touches Tk widgets. A
+    load that raised is delivered too, with its exception, so the caller
+    can tell a failure from a result it has yet to receive.
+    """
+
+    def __init__(self, load, name="habitrack-prefetch"):
+        self.load = load
+        self._cond = threading.Condition()
+        self._pending = []
+        self._tag = None
+        self._results = []
+        self._running = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def request(self, keys, tag=None):
+        """Queue keys in priority order, dropping any older queued keys.
+
+        tag is returned with each result (e.g. the data version the request
+        was made under) so the caller can discard results that went stale.
+        """
+        with self._cond:
+            self._pending = list(keys)
+            self._tag = tag
+            self._cond.notify()
+
+    def drain(self):
+        """Return and clear finished (key, tag, result, error) tuples.
+
+        error is None when load(key) returned, else the exception it
+        raised (and result is None).
+        """
+        with self._cond:
+            results, self._results = self._results, []
+        return results
+
+    def idle(self):
+        """True when nothing is queued, loading, or waiting to be drained."""
+        with self._cond:
+            return not (self._pending or self._running or self._results)
+
+    def close(self):
+        """Stop the worker after its current job."""
+        with self._cond:
+            self._closed = True
+            self._pending = []
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                key = self._pending.pop(0)
+                tag = self._tag
+                self._running = True
+
+            result = error = None
+            try:
+                result = self.load(key)
+            except Exception as e:
+                print(f"Prefetch of {key} failed: {e}")
+                error = e
+
+            with self._cond:
+                self._running = False
+                if not self._closed:
+                    self._results.append((key, tag, result, error))
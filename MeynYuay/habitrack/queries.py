@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from habitrack.db import DB_PATH, get_connection
+from habitrack.streaks import read_streaks
+
+
+## Typed read functions shared by MainUI, ProgressUI and Debugging.
+# Logs are written only by habitrack.writer (through db.record_logs).
+# Every function runs on the calling thread's pooled connection (see
+# habitrack.db.get_connection), so no caller opens or closes connections.
+# The SQL strings are constants, so each is compiled once per connection.
+
+class DayTotals(NamedTuple):
+    day: str        # 'YYYY-MM-DD'
+    total: int
+    completed: int
+
+
+class HabitTotals(NamedTuple):
+    name: str
+    total: int
+    completed: int
+
+
+class LogEntry(NamedTuple):
+    id: int
+    name: str
+    done: bool
+    logged_at: str  # 'YYYY-MM-DD HH:MM:SS'
+
+
+DAY_TOTALS_SQL = """
+    SELECT day, total, completed
+    FROM daily_rollup
+    WHERE day BETWEEN ? AND ?
+    ORDER BY day
+"""
+
+HABIT_MONTH_TOTALS_SQL = """
+    SELECT h.name, r.total, r.completed
+    FROM habit_monthly_rollup r
+    JOIN habits h ON h.id = r.habit_id
+    WHERE r.month = ?
+    ORDER BY h.name
+"""
+
+LOGS_FOR_DATE_SQL = """
+    SELECT l.id, h.name, l.done, l.logged_at
+    FROM habit_logs l
+    JOIN habits h ON h.id = l.habit_id
+    WHERE l.log_date = ?
+    ORDER BY l.logged_at, l.id
+"""
+
+
+def month_bounds(year: int, month: int) -> Tuple[str, str]:
+    """Return ('YYYY-MM-01', 'YYYY-MM-<last day>') for a month."""
+    first = date(year, month, 1)
+    last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return first.isoformat(), last.isoformat()
+
+
+def day_totals(start: str, end: str, db_path=DB_PATH) -> List[DayTotals]:
+    """Return the logged days between start and end ('YYYY-MM-DD', inclusive)."""
+    rows = get_connection(db_path).execute(DAY_TOTALS_SQL, (start, end))
+    return [DayTotals(*row) for row in rows]
+
+
+def day_total(day: str, db_path=DB_PATH) -> Optional[DayTotals]:
+    """Return the totals for one day, or None if nothing was logged that day."""
+    rows = day_totals(day, day, db_path)
+    return rows[0] if rows else None
+
+
+def habit_month_totals(month: str, db_path=DB_PATH) -> List[HabitTotals]:
+    """Return per-habit totals for month ('YYYY-MM'), ordered by habit name."""
+    rows = get_connection(db_path).execute(HABIT_MONTH_TOTALS_SQL, (month,))
+    return [HabitTotals(*row) for row in rows]
+
+
+def logs_for_date(day: str, db_path=DB_PATH) -> List[LogEntry]:
+    """Return every log row recorded on day ('YYYY-MM-DD'), oldest first."""
+    rows = get_connection(db_path).execute(LOGS_FOR_DATE_SQL, (day,))
+    return [LogEntry(log_id, name, bool(done), logged_at) for log_id, name, done, logged_at in rows]
+
+
+def current_streaks(today: Optional[str] = None, db_path=DB_PATH) -> Dict[str, int]:
+    """Return {habit name: consecutive completed days ending today}."""
+    streaks = read_streaks(get_connection(db_path).cursor(), today)
+    return {name: stats["current_streak"] for name, stats in streaks.items()}
+
@@ -0,0 +1,99 @@
+import sqlite3
+
+
+## Precomputed aggregates over habit_logs
+# daily_rollup:         one row per day      -> calendar + monthly statistics
+# habit_monthly_rollup: one row per habit and month ('YYYY-MM') -> breakdown/pie chart
+# Writers keep them up to date in the same transaction as their inserts;
+# rebuild_rollups() regenerates both from the raw logs.
+
+def create_rollup_tables(cur):
+    """Create the rollup tables if they do not exist."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS daily_rollup (
+            day       TEXT PRIMARY KEY,       -- 'YYYY-MM-DD'
+            total     INTEGER NOT NULL,
+            completed INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS habit_monthly_rollup (
+            month     TEXT NOT NULL,          -- 'YYYY-MM'
+            habit_id  INTEGER NOT NULL REFERENCES habits(id),
+            total     INTEGER NOT NULL,
+            completed INTEGER NOT NULL,
+            PRIMARY KEY (month, habit_id)
+        ) WITHOUT ROWID
+    """)
+
+
+def add_to_rollups(cur, log_date, entries):
+    """Fold one recorded batch into the rollups.
+
+    Args:
+        cur: cursor inside the transaction that inserted the logs.
+        log_date (str): "YYYY-MM-DD" the batch was logged on.
+        entries: list of (habit_id, done) pairs that were inserted.
+    """
+    if not entries:
+        return
+
+    completed = sum(1 for _, done in entries if done)
+    cur.execute("""
+        INSERT INTO daily_rollup (day, total, completed)
+        VALUES (?, ?, ?)
+        ON CONFLICT(day) DO UPDATE SET
+            total     = total + excluded.total,
+            completed = completed + excluded.completed
+    """, (log_date, len(entries), completed))
+
+    month = log_date[:7]
+    cur.executemany("""
+        INSERT INTO habit_monthly_rollup (month, habit_id, total, completed)
+        VALUES (?, ?, 1, ?)
+        ON CONFLICT(month, habit_id) DO UPDATE SET
+            total     = total + 1,
+            completed = completed + excluded.completed
+    """, [(month, habit_id, 1 if done else 0) for habit_id, done in entries])
+
+
+def rebuild_rollups(cur):
+    """Regenerate both rollup tables from habit_logs."""
+    create_rollup_tables(cur)
+    cur.execute("DELETE FROM daily_rollup")
+    cur.execute("DELETE FROM habit_monthly_rollup")
+    cur.execute("""
+        INSERT INTO daily_rollup (day, total, completed)
+        SELECT log_date,
+               COUNT(*),
+               SUM(CASE WHEN done = 1 THEN 1 ELSE 0 END)
+        FROM habit_logs
+        GROUP BY log_date
+    """)
+    cur.execute("""
+        INSERT INTO habit_monthly_rollup (month, habit_id, total, completed)
+        SELECT SUBSTR(log_date, 1, 7),
+               habit_id,
+               COUNT(*),
+               SUM(CASE WHEN done = 1 THEN 1 ELSE 0 END)
+        FROM habit_logs
+        GROUP BY SUBSTR(log_date, 1, 7), habit_id
+    """)
+
+
+## Rebuild command: python -m habitrack.rollups (run from the MeynYuay folder)
+if __name__ == "__main__":
+    from habitrack.db import DB_PATH, init_db
+
+    init_db()
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        cur = conn.cursor()
+        cur.execute("BEGIN")
+        rebuild_rollups(cur)
+        conn.commit()
+        days = cur.execute("SELECT COUNT(*) FROM daily_rollup").fetchone()[0]
+        months = cur.execute("SELECT COUNT(*) FROM habit_monthly_rollup").fetchone()[0]
+        print(f"Rebuilt rollups: {days} day(s), {months} habit-month(s) in {DB_PATH}")
+    finally:
+        conn.close()
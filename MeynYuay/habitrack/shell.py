@@ -0,0 +1,156 @@
+import importlib.util
+import sys
+import tkinter as tk
+from pathlib import Path
+
+MEINYUAY_DIR = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = MEINYUAY_DIR.parent
+
+# Screen scripts hosted by the shell
+SCREEN_SCRIPTS = {
+    "login": PROJECT_ROOT / "LoginUI" / "New folder" / "build" / "Login.py",
+    "main": MEINYUAY_DIR / "MainUI.py",
+    "habits": PROJECT_ROOT / "Habits_" / "Habits.py",
+}
+
+_shell = None     # the running AppShell, if any
+_loading = None   # ScreenFrame whose screen is being built right now
+
+
+## Single-process app shell
+# Login, MainUI, Habits and ProgressUI each build their UI inside a
+# ScreenFrame under one Tk root. A screen is built the first time it is
+# shown and kept afterwards, so navigating is just swapping frames and the
+# loaded habits stay in memory. Run standalone (no shell), every screen
+# still creates its own Tk window and navigates by launching scripts.
+
+class ScreenFrame(tk.Frame):
+    """Top-level container of one hosted screen.
+
+    Screens were written against a Tk window, so the window-manager calls
+    they make (title, geometry, resizable, mainloop) are accepted here and
+    applied to the shared root while the screen is showing.
+    """
+
+    def __init__(self, shell):
+        super().__init__(shell.root)
+        self.shell = shell
+        self.window_title = None
+        self.window_geometry = None
+        self.window_resizable = None
+        self.on_show_callbacks = []
+
+    def title(self, text=None):
+        if text is None:
+            return self.window_title or ""
+        self.window_title = text
+        self.apply_window_options()
+
+    def geometry(self, spec=None):
+        if spec is None:
+            return self.shell.root.geometry()
+        self.window_geometry = spec
+        self.apply_window_options()
+
+    def resizable(self, width=None, height=None):
+        if width is None and height is None:
+            return self.window_resizable
+        self.window_resizable = (width, height)
+        self.apply_window_options()
+
+    def mainloop(self, n=0):
+        """No-op: the shell runs the one main loop."""
+
+    def apply_window_options(self):
+        if self.shell.current is not self:
+            return
+        root = self.shell.root
+        root.title(self.window_title or "HabiTrack - Habit Tracker App")
+        if self.window_geometry:
+            root.geometry(self.window_geometry)
+        root.resizable(*(self.window_resizable or (True, True)))
+
+
+class AppShell:
+    """One Tk root hosting every screen as a frame."""
+
+    def __init__(self):
+        self.root = tk.Tk()
+        self.frames = {}
+        self.current = None
+        self.shared = {}
+
+    def build(self, name):
+        """Build screen `name` inside a new ScreenFrame."""
+        global _loading
+        frame = ScreenFrame(self)
+        _loading = frame
+        try:
+            if name == "progress":
+                from ProgressUI import ProgressUI
+                ui = ProgressUI(container=frame)
+                frame.on_show_callbacks.append(ui.load_monthly_data)
+            else:
+                path = SCREEN_SCRIPTS[name]
+                spec = importlib.util.spec_from_file_location(f"habitrack_screen_{name}", path)
+                module = importlib.util.module_from_spec(spec)
+                sys.path.insert(0, str(path.parent))
+                spec.loader.exec_module(module)
+        finally:
+            _loading = None
+        self.frames[name] = frame
+        return frame
+
+    def show(self, name):
+        """Switch to screen `name`, building it on first use."""
+        frame = self.frames.get(name) or self.build(name)
+        if self.current is frame:
+            return
+        if self.current is not None:
+            self.current.pack_forget()
+        self.current = frame
+        frame.pack(fill="both", expand=True)
+        frame.apply_window_options()
+        for callback in frame.on_show_callbacks:
+            callback()
+
+    def run(self, first="login"):
+        global _shell
+        _shell = self
+        self.show(first)
+        self.root.mainloop()
+
+
+## Helpers for screen scripts (all work the same with or without a shell)
+
+def create_window():
+    """Return the screen's top-level: its ScreenFrame under the shell, else a new Tk()."""
+    if _loading is not None:
+        return _loading
+    return tk.Tk()
+
+
+def show_screen(name):
+    """Navigate to another screen in-process. Returns False when there is no shell."""
+    if _shell is None:
+        return False
+    _shell.show(name)
+    return True
+
+
+def on_show(callback):
+    """Call callback each time the screen being built is shown again."""
+    if _loading is not None:
+        _loading.on_show_callbacks.append(callback)
+
+
+def share(key, value):
+    """Return the object every screen shares under key (value if first / standalone)."""
+    if _shell is None:
+        return value
+    return _shell.shared.setdefault(key, value)
+
+
+def run_app(first="login"):
+    """Start HabiTrack as a single process."""
+    AppShell().run(first)
@@ -0,0 +1,238 @@
+import sqlite3
+from datetime import date, datetime, timedelta
+
+# Max host parameters per "IN (...)" query (older SQLite builds allow 999)
+PARAMS_PER_QUERY = 500
+
+
+## Streak engine
+# Gaps-and-islands: within one habit, consecutive completed days share the
+# same (julianday - row_number) value, so grouping on it yields each run.
+RUNS_CTE = """
+    WITH done_days AS (
+        SELECT DISTINCT habit_id, log_date
+        FROM habit_logs
+        WHERE done = 1
+    ),
+    islands AS (
+        SELECT habit_id,
+               log_date,
+               JULIANDAY(log_date)
+                   - ROW_NUMBER() OVER (PARTITION BY habit_id ORDER BY log_date) AS grp
+        FROM done_days
+    ),
+    runs AS (
+        SELECT habit_id,
+               COUNT(*) AS length,
+               MAX(log_date) AS last_day
+        FROM islands
+        GROUP BY habit_id, grp
+    )
+"""
+
+# One query returns the current and best streak for every logged habit
+STREAKS_SQL = RUNS_CTE + """
+    SELECT h.name,
+           COALESCE(MAX(CASE WHEN r.last_day = ? THEN r.length END), 0) AS current_streak,
+           COALESCE(MAX(r.length), 0) AS best_streak
+    FROM habits h
+    LEFT JOIN runs r ON r.habit_id = h.id
+    WHERE h.id IN (SELECT habit_id FROM habit_logs)
+    GROUP BY h.id
+    ORDER BY h.name
+"""
+
+# Latest run + best run per habit, in habit_streaks column order
+STREAK_STATE_SQL = RUNS_CTE + """,
+    latest AS (
+        SELECT habit_id,
+               MAX(last_day) AS last_day,
+               MAX(length) AS best
+        FROM runs
+        GROUP BY habit_id
+    )
+    SELECT h.id,
+           COALESCE(r.length, 0),
+           COALESCE(l.best, 0),
+           l.last_day
+    FROM habits h
+    LEFT JOIN latest l ON l.habit_id = h.id
+    LEFT JOIN runs r ON r.habit_id = l.habit_id AND r.last_day = l.last_day
+    WHERE h.id IN (SELECT habit_id FROM habit_logs)
+"""
+
+
+def compute_streaks(cur, today=None):
+    """Return {habit name: {"current_streak": int, "best_streak": int}}.
+
+    The current streak counts consecutive completed days ending today
+    (0 if the habit is not done today), matching ProgressUI.
+
+    Args:
+        cur: sqlite3 cursor on the habits database.
+        today (str): "YYYY-MM-DD" to count back from. Defaults to today.
+    """
+    if today is None:
+        today = datetime.now().strftime("%Y-%m-%d")
+
+    cur.execute(STREAKS_SQL, (today,))
+    return {
+        name: {"current_streak": current, "best_streak": best}
+        for name, current, best in cur.fetchall()
+    }
+
+
+## Persisted streak state
+# habit_streaks holds, per habit, the length of the run ending on
+# last_done_day plus the best run ever. record_habits only adds one day,
+# so update_streaks() advances it in O(1) per habit instead of rescanning.
+
+def create_streak_table(cur):
+    """Create the habit_streaks table if it does not exist."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS habit_streaks (
+            habit_id       INTEGER PRIMARY KEY REFERENCES habits(id),
+            current_streak INTEGER NOT NULL,   -- run ending on last_done_day
+            best_streak    INTEGER NOT NULL,
+            last_done_day  TEXT                -- 'YYYY-MM-DD', NULL if never done
+        )
+    """)
+
+
+def read_streak_state(cur, habit_ids):
+    """Return {habit_id: (current_streak, best_streak, last_done_day)} for stored habits."""
+    habit_ids = list(dict.fromkeys(habit_ids))
+    states = {}
+    for start in range(0, len(habit_ids), PARAMS_PER_QUERY):
+        chunk = habit_ids[start:start + PARAMS_PER_QUERY]
+        placeholders = ", ".join("?" * len(chunk))
+        cur.execute(f"""
+            SELECT habit_id, current_streak, best_streak, last_done_day
+            FROM habit_streaks
+            WHERE habit_id IN ({placeholders})
+        """, chunk)
+        states.update((row[0], row[1:]) for row in cur.fetchall())
+    return states
+
+
+def update_streaks(cur, log_date, entries):
+    """Advance habit_streaks for one recorded batch.
+
+    Days older than a habit's last_done_day (backfills) cannot be applied
+    incrementally; those habits are recomputed with rebuild_streaks().
+
+    Args:
+        cur: cursor inside the transaction that inserted the logs.
+        log_date (str): "YYYY-MM-DD" the batch was logged on.
+        entries: list of (habit_id, done) pairs that were inserted.
+    """
+    day_before = (date.fromisoformat(log_date) - timedelta(days=1)).isoformat()
+    states = read_streak_state(cur, [habit_id for habit_id, _ in entries])
+    changed = set()
+    stale = []
+
+    for habit_id, done in entries:
+        state = states.get(habit_id)
+        current, best, last_done = state if state else (0, 0, None)
+
+        if not done:
+            # A missed entry does not end a run by itself; only the gap does
+            if state is None:
+                states[habit_id] = (0, 0, None)
+                changed.add(habit_id)
+            continue
+
+        if last_done is not None and log_date < last_done:
+            stale.append(habit_id)
+            continue
+        if last_done == log_date:
+            continue  # this day is already counted
+
+        current = current + 1 if last_done == day_before else 1
+        states[habit_id] = (current, max(best, current), log_date)
+        changed.add(habit_id)
+
+    cur.executemany(
+        "INSERT OR REPLACE INTO habit_streaks VALUES (?, ?, ?, ?)",
+        [(habit_id, *states[habit_id]) for habit_id in changed]
+    )
+    if stale:
+        rebuild_streaks(cur, stale)
+
+
+def rebuild_streaks(cur, habit_ids=None):
+    """Recompute habit_streaks from habit_logs (all habits, or just habit_ids)."""
+    create_streak_table(cur)
+    if habit_ids is None:
+        cur.execute("DELETE FROM habit_streaks")
+        cur.execute("INSERT INTO habit_streaks " + STREAK_STATE_SQL)
+        return
+
+    placeholders = ", ".join("?" * len(habit_ids))
+    cur.execute(
+        f"DELETE FROM habit_streaks WHERE habit_id IN ({placeholders})", habit_ids
+    )
+    cur.execute(
+        "INSERT INTO habit_streaks " + STREAK_STATE_SQL + f" AND h.id IN ({placeholders})",
+        habit_ids
+    )
+
+
+def verify_streaks(cur):
+    """Return the ids of habits whose stored streak state is out of date."""
+    cur.execute(STREAK_STATE_SQL)
+    expected = {row[0]: row for row in cur.fetchall()}
+    cur.execute("SELECT habit_id, current_streak, best_streak, last_done_day FROM habit_streaks")
+    stored = {row[0]: row for row in cur.fetchall()}
+    return sorted(
+        habit_id for habit_id in expected.keys() | stored.keys()
+        if expected.get(habit_id) != stored.get(habit_id)
+    )
+
+
+def read_streaks(cur, today=None):
+    """Return {habit name: {"current_streak": int, "best_streak": int}} from habit_streaks.
+
+    Same result as compute_streaks(cur, today), read from the persisted
+    state, as long as no habit has a completed day after today (always the
+    case for the default today unless logs are future-dated). habit_streaks
+    only keeps each habit's latest run, so for a backdated today a habit
+    whose latest run ends later gets current_streak 0, even where
+    compute_streaks() finds a run ending on today. best_streak is the
+    all-time best either way.
+    """
+    if today is None:
+        today = datetime.now().strftime("%Y-%m-%d")
+
+    cur.execute("""
+        SELECT h.name,
+               CASE WHEN s.last_done_day = ? THEN s.current_streak ELSE 0 END,
+               s.best_streak
+        FROM habit_streaks s
+        JOIN habits h ON h.id = s.habit_id
+        ORDER BY h.name
+    """, (today,))
+    return {
+        name: {"current_streak": current, "best_streak": best}
+        for name, current, best in cur.fetchall()
+    }
+
+
+## Verify/rebuild command: python -m habitrack.streaks (run from the MeynYuay folder)
+if __name__ == "__main__":
+    from habitrack.db import DB_PATH, init_db
+
+    init_db()
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        cur = conn.cursor()
+        stale = verify_streaks(cur)
+        if not stale:
+            print(f"habit_streaks is up to date in {DB_PATH}")
+        else:
+            cur.execute("BEGIN")
+            rebuild_streaks(cur)
+            conn.commit()
+            print(f"Rebuilt habit_streaks ({len(stale)} habit(s) were out of date) in {DB_PATH}")
+    finally:
+        conn.close()
@@ -0,0 +1,198 @@
+import atexit
+import csv
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from habitrack.db import DB_PATH, get_connection, record_logs
+
+
+class Writer:
+    """Run database and file writes on one background thread.
+
+    record() queues a batch of habit logs. Every batch queued while the
+    thread was busy is written in a single transaction (group commit); if
+    that fails, the batches are retried one transaction each, so only the
+    failing batch reports an error.
+    submit() queues any other write under a key. A queued job is replaced
+    by a newer one with the same key (e.g. two syncs of the habit list), so
+    only the latest runs. Each job can have on_done/on_error callbacks;
+    they are collected with drain() (or delivered by watch()) on the Tk
+    thread; nothing here touches Tk widgets.
+    """
+
+    POLL_MS = 50
+
+    def __init__(self, db_path=DB_PATH, name="habitrack-writer"):
+        self.db_path = db_path
+        self._cond = threading.Condition()
+        self._batches = []           # (habits, logged_at, callbacks)
+        self._jobs = OrderedDict()   # key -> (job, [callbacks])
+        self._results = []           # (callback, value) ready for the Tk thread
+        self._running = False
+        self._closed = False
+        self._watching = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def record(self, habits, logged_at=None, on_done=None, on_error=None):
+        """Queue one "Record" action: a log row per {"name", "done"} habit.
+
+        The habits are copied now, so later edits in the UI do not leak
+        into the batch. on_done receives the number of rows written.
+        """
+        snapshot = [{"name": h["name"], "done": bool(h.get("done"))} for h in habits]
+        with self._cond:
+            self._batches.append((snapshot, logged_at or datetime.now(), (on_done, on_error)))
+            self._cond.notify()
+
+    def submit(self, key, job, on_done=None, on_error=None):
+        """Queue job() under key, replacing a queued job with the same key.
+
+        The callbacks of a replaced job move to its replacement, since the
+        newer write supersedes it; a pair already registered for the key is
+        not added twice, so it is called once per run. on_done receives
+        job()'s return value.
+        """
+        with self._cond:
+            callbacks = self._jobs.pop(key, (None, []))[1]
+            if (on_done, on_error) not in callbacks:
+                callbacks.append((on_done, on_error))
+            self._jobs[key] = (job, callbacks)
+            self._cond.notify()
+
+    def drain(self):
+        """Return and clear finished (callback, value) pairs."""
+        with self._cond:
+            results, self._results = self._results, []
+        return results
+
+    def idle(self):
+        """True when nothing is queued, being written, or waiting to be drained."""
+        with self._cond:
+            return not (self._batches or self._jobs or self._running or self._results)
+
+    def watch(self, window):
+        """Deliver callbacks from window's event loop until the writer is idle."""
+        if self._watching:
+            return
+        self._watching = True
+
+        def poll():
+            for callback, value in self.drain():
+                callback(value)
+            if self.idle():
+                self._watching = False
+            else:
+                window.after(self.POLL_MS, poll)
+
+        window.after(self.POLL_MS, poll)
+
+    def flush(self, timeout=None):
+        """Block until every queued write has finished. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not (self._batches or self._jobs or self._running), timeout
+            )
+
+    def close(self):
+        """Finish the queued writes, then stop the thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not (self._batches or self._jobs or self._closed):
+                    self._cond.wait()
+                if not (self._batches or self._jobs):
+                    return  # closed and drained
+                batches, self._batches = self._batches, []
+                jobs, self._jobs = self._jobs, OrderedDict()
+                self._running = True
+
+            results = []
+            if batches:
+                results += self._commit_batches(batches)
+            for job, callbacks in jobs.values():
+                results += self._run_job(job, callbacks)
+
+            with self._cond:
+                self._running = False
+                self._results.extend(
+                    (callback, value) for callback, value in results if callback is not None
+                )
+                self._cond.notify_all()
+
+    def _commit_batches(self, batches):
+        conn = get_connection(self.db_path)
+        try:
+            with conn:
+                cur = conn.cursor()
+                for habits, logged_at, _ in batches:
+                    record_logs(
+                        cur, habits,
+                        logged_at.strftime("%Y-%m-%d %H:%M:%S"), logged_at.strftime("%Y-%m-%d")
+                    )
+        except Exception as e:
+            if len(batches) > 1:
+                # Rolled back as a whole; find the batch that failed
+                results = []
+                for batch in batches:
+                    results += self._commit_batches([batch])
+                return results
+            print(f"Writing record failed: {e}")
+            return [(batches[0][2][1], e)]
+        return [(on_done, len(habits)) for habits, _, (on_done, _) in batches]
+
+    def _run_job(self, job, callbacks):
+        try:
+            value = job()
+        except Exception as e:
+            print(f"Background write failed: {e}")
+            return [(on_error, e) for _, on_error in callbacks]
+        return [(on_done, value) for on_done, _ in callbacks]
+
+
+def write_csv(path, header, rows):
+    """Replace path with header + rows atomically; returns the number of rows.
+
+    rows can be any iterable (e.g. a cursor); it is written as it is read.
+    The rows go to a temp file in the same folder, which is synced and then
+    renamed over path, so a crash leaves either the old file or the new one.
+    """
+    tmp_path = f"{path}.tmp"
+    count = 0
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for count, row in enumerate(rows, start=1):
+            writer.writerow(row)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return count
+
+
+## One writer per process, shared by every screen in the app shell
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    """Return the process-wide Writer, starting it on first use."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = Writer()
+    return _writer
+
+
+@atexit.register
+def flush_on_exit():
+    """Finish queued writes before the interpreter exits (e.g. the window was closed)."""
+    if _writer is not None:
+        _writer.close()
@@ -0,0 +1,120 @@
+"""Benchmark: loading habits.csv with pandas, the list-based csv loader and iter_habits().
+
+Usage:
+    python benchmarks/bench_csv_load.py [--rows 1000000] [--no-pandas]
+
+Writes a throwaway name/done CSV (never the real one) and, for each
+loader, reports the wall time to build MainUI's habit list and the peak
+Python memory (tracemalloc, measured in a separate run) both for building
+that list and for just streaming through the file. The pandas loader is
+the original MainUI.load_habits_csv (read_csv + iterrows) and is skipped
+when pandas is not installed.
+"""
+import argparse
+import csv
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import common  # noqa: F401  (puts MeynYuay on sys.path)
+from habitrack.habits_csv import iter_habits
+
+
+def pandas_loader(path):
+    """The original loader: pd.read_csv + iterrows with per-row coercion."""
+    import pandas as pd
+
+    df = pd.read_csv(path)
+    if "position" in df.columns:
+        df = df.sort_values("position", ignore_index=True)
+    for _, row in df.iterrows():
+        name = row.get("name", "")
+        done_val = row.get("done", 0)
+        done = False
+        if isinstance(done_val, str):
+            done = done_val.strip().lower() in ("1", "true", "yes", "y")
+        else:
+            try:
+                done = bool(int(done_val))
+            except Exception:
+                done = False
+        yield {"name": str(name), "done": done}
+
+
+def dictreader_loader(path):
+    """The previous csv loader: DictReader, whole file read into a list first."""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        done = (row.get("done") or "0").strip().lower() in ("1", "true", "yes", "y")
+        yield {"name": row.get("name") or "", "done": done}
+
+
+def write_csv(path, n_rows):
+    rng = random.Random(42)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "done"])
+        for i in range(n_rows):
+            writer.writerow([f"Habit {i:07d}", rng.random() < 0.5])
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def peak_mib(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def consume(rows):
+    for _ in rows:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--no-pandas", action="store_true", help="skip the pandas loader")
+    args = parser.parse_args()
+
+    loaders = [("csv.DictReader list", dictreader_loader), ("iter_habits", iter_habits)]
+    if not args.no_pandas:
+        try:
+            import pandas  # noqa: F401  (imported here so its import time is not measured)
+            loaders.insert(0, ("pandas iterrows", pandas_loader))
+        except ImportError:
+            print("pandas not installed; skipping the pandas loader")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "habits.csv"
+        write_csv(path, args.rows)
+        size_mib = path.stat().st_size / 2**20
+        print(f"{args.rows} rows, {size_mib:.1f} MiB")
+        print(f"{'loader':<22} {'load list':>10} {'peak (list)':>12} {'peak (stream)':>14}")
+
+        expected = None
+        for label, loader in loaders:
+            habits = []
+            elapsed = timed(lambda: habits.extend(loader(path)))
+            if expected is None:
+                expected = habits
+            assert habits == expected, f"{label} loaded different habits"
+            del habits
+
+            list_peak = peak_mib(lambda: list(loader(path)))
+            stream_peak = peak_mib(lambda: consume(loader(path)))
+            print(f"{label:<22} {elapsed:>9.2f}s {list_peak:>9.0f} MiB {stream_peak:>11.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
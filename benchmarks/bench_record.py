@@ -0,0 +1,114 @@
+"""Benchmark: recording throughput of MainUI's Record action.
+
+Usage:
+    python benchmarks/bench_record.py [--habits 10000] [--records 5] [--dir PATH]
+
+Records the same habit list once a day for a few days on a throwaway
+database (never the real one), with the previous one-INSERT-per-habit
+loop in rollback-journal mode and with record_logs() (executemany, WAL,
+synchronous=NORMAL). Both include the rollup and streak updates and the
+commit, which is what the user waits for. Commit cost depends on the disk:
+use --dir to put the temporary databases on the drive HabiTrack runs from.
+"""
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import common  # noqa: F401  (puts MeynYuay on sys.path)
+from habitrack.db import connect, get_habit_id, init_db, record_logs
+from habitrack.rollups import add_to_rollups
+from habitrack.streaks import update_streaks
+
+
+def legacy_record(db_path, habits, logged_at, log_date):
+    """The previous record_habits: fresh connection, one execute per habit."""
+    conn = sqlite3.connect(db_path)
+    cur = conn.cursor()
+    entries = []
+    for habit in habits:
+        habit_id = get_habit_id(cur, habit["name"])
+        cur.execute(
+            "INSERT INTO habit_logs (habit_id, done, logged_at, log_date) VALUES (?, ?, ?, ?)",
+            (habit_id, int(habit["done"]), logged_at, log_date)
+        )
+        entries.append((habit_id, habit["done"]))
+    add_to_rollups(cur, log_date, entries)
+    update_streaks(cur, log_date, entries)
+    conn.commit()
+    conn.close()
+
+
+def batched_record(db_path, habits, logged_at, log_date):
+    conn = connect(db_path)
+    with conn:
+        record_logs(conn.cursor(), habits, logged_at, log_date)
+    conn.close()
+
+
+def run(record, db_path, habits, n_records, wal):
+    init_db(db_path)
+    if not wal:
+        # init_db() switches new databases to WAL; measure the old default
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA journal_mode = DELETE")
+        conn.close()
+
+    start_day = date.today() - timedelta(days=n_records)
+    times = []
+    for i in range(n_records):
+        log_date = (start_day + timedelta(days=i)).isoformat()
+        start = time.perf_counter()
+        record(db_path, habits, f"{log_date} 20:00:00", log_date)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--habits", type=int, default=10_000)
+    parser.add_argument("--records", type=int, default=5)
+    parser.add_argument("--dir", help="folder for the temporary databases")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    habits = [
+        {"name": f"Habit {i:05d}", "done": rng.random() < 0.8}
+        for i in range(args.habits)
+    ]
+
+    print(f"{args.habits} habits, {args.records} records (first one also creates the habits)")
+    print(f"{'':<22} {'first':>9} {'median':>9} {'rows/s':>10}")
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        results = {}
+        for label, record, wal in (
+            ("legacy per-row loop", legacy_record, False),
+            ("executemany + WAL", batched_record, True),
+        ):
+            db_path = Path(tmp) / f"{record.__name__}.db"
+            times = run(record, db_path, habits, args.records, wal)
+            steady = sorted(times[1:] or times)[len(times[1:] or times) // 2]
+            results[label] = steady
+            print(f"{label:<22} {times[0] * 1000:>7.0f}ms {steady * 1000:>7.0f}ms "
+                  f"{args.habits / steady:>10.0f}")
+
+        # Both databases must hold the same logs, rollups and streaks
+        dumps = []
+        for record in (legacy_record, batched_record):
+            conn = sqlite3.connect(Path(tmp) / f"{record.__name__}.db")
+            dumps.append([
+                conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2").fetchall()
+                for table in ("daily_rollup", "habit_monthly_rollup", "habit_streaks")
+            ])
+            conn.close()
+        assert dumps[0] == dumps[1], "batched record disagrees with the legacy loop"
+
+    legacy, batched = results.values()
+    print(f"speedup: {legacy / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
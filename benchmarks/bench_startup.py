@@ -0,0 +1,90 @@
+"""Benchmark: time to first paint for each HabiTrack entry point.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5]
+
+Each screen is started in a fresh interpreter, the same way Login.py
+launches it. mainloop() is replaced with one update() (which lays out and
+draws the window) followed by an exit, so the measured time covers the
+interpreter start, imports, data loading and the first frame. The screens
+run on a temporary copy of the project, so the real database and CSV are
+never touched. Needs a display (on Linux, e.g. run under xvfb-run).
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY_POINTS = [
+    ("Login", Path("LoginUI") / "New folder" / "build" / "Login.py"),
+    ("MainUI", Path("MeynYuay") / "MainUI.py"),
+    ("Habits", Path("Habits_") / "Habits.py"),
+    ("ProgressUI", Path("MeynYuay") / "ProgressUI.py"),
+]
+
+# Runs inside the child: stop at the first painted frame
+BOOTSTRAP = r"""
+import runpy, sys, tkinter
+from pathlib import Path
+
+def first_paint(self, n=0):
+    self.update()
+    print("FIRST_PAINT", flush=True)
+    raise SystemExit(0)
+
+tkinter.Misc.mainloop = first_paint
+script = Path(sys.argv[1])
+sys.argv = [str(script)]
+sys.path.insert(0, str(script.parent))
+runpy.run_path(str(script), run_name="__main__")
+"""
+
+
+def time_to_first_paint(script):
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", BOOTSTRAP, str(script)],
+        cwd=str(script.parent),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    for line in proc.stdout:
+        if line.strip() == "FIRST_PAINT":
+            elapsed = time.perf_counter() - start
+            proc.wait()
+            return elapsed
+    proc.wait()
+    raise RuntimeError(f"{script.name} exited without painting:\n{proc.stderr.read()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        sys.exit("No DISPLAY set; run under a display server (e.g. xvfb-run).")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for folder in ("LoginUI", "MeynYuay", "Habits_"):
+            shutil.copytree(
+                PROJECT_ROOT / folder, Path(tmp) / folder,
+                ignore=shutil.ignore_patterns("__pycache__"),
+            )
+
+        print(f"{'entry point':<12} {'min':>9} {'median':>9}   ({args.runs} runs)")
+        for name, rel_path in ENTRY_POINTS:
+            times = [time_to_first_paint(Path(tmp) / rel_path) for _ in range(args.runs)]
+            print(f"{name:<12} {min(times) * 1000:>7.0f}ms {statistics.median(times) * 1000:>7.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark: per-habit streak loop vs. the single-query streak engine.
+
+Usage:
+    python benchmarks/bench_streaks.py [--habits 300] [--days 1095]
+
+Builds a throwaway database (never the real one), fills it with random
+daily logs and times both implementations on the same data.
+"""
+import argparse
+import sqlite3
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from common import best_of, build_log_db
+from habitrack.streaks import compute_streaks
+
+
+def legacy_streaks(cur, today):
+    """The previous ProgressUI.calculate_habit_streaks: one query per habit."""
+    cur.execute("""
+        SELECT id, name
+        FROM habits
+        WHERE id IN (SELECT habit_id FROM habit_logs)
+        ORDER BY name
+    """)
+    streaks = {}
+    for habit_id, habit in cur.fetchall():
+        cur.execute("""
+            SELECT DISTINCT log_date
+            FROM habit_logs
+            WHERE habit_id = ? AND done = 1
+            ORDER BY log_date DESC
+        """, (habit_id,))
+        dates = [datetime.strptime(row[0], "%Y-%m-%d").date() for row in cur.fetchall()]
+        current_streak = 0
+        expected_date = today
+        for log_date in dates:
+            if log_date == expected_date:
+                current_streak += 1
+                expected_date = expected_date - timedelta(days=1)
+            else:
+                break
+        streaks[habit] = current_streak
+    return streaks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--habits", type=int, default=300)
+    parser.add_argument("--days", type=int, default=3 * 365)
+    args = parser.parse_args()
+
+    today = date.today()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        n_rows = build_log_db(
+            db_path, args.habits, today - timedelta(days=args.days), args.days + 1, done_rate=0.8
+        )
+        conn = sqlite3.connect(db_path)
+        cur = conn.cursor()
+
+        legacy_t, legacy = best_of(lambda: legacy_streaks(cur, today))
+        engine_t, engine = best_of(lambda: compute_streaks(cur, today.strftime("%Y-%m-%d")))
+        conn.close()
+
+    current = {name: s["current_streak"] for name, s in engine.items()}
+    assert current == legacy, "streak engine disagrees with the legacy loop"
+
+    print(f"{args.habits} habits x {args.days + 1} days = {n_rows} log rows")
+    print(f"{'legacy N+1 loop':<20} {legacy_t * 1000:>10.1f} ms")
+    print(f"{'streak engine':<20} {engine_t * 1000:>10.1f} ms  ({legacy_t / engine_t:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Helpers shared by the benchmark scripts.
+
+Importing this module puts the MeynYuay folder on sys.path, so a script
+can import habitrack right after it:
+
+    from common import best_of, build_log_db
+    from habitrack.streaks import compute_streaks
+"""
+import random
+import sqlite3
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+MEINYUAY_DIR = Path(__file__).resolve().parent.parent / "MeynYuay"
+sys.path.insert(0, str(MEINYUAY_DIR))
+
+from habitrack.db import get_habit_ids, init_db
+
+
+def time_runs(fn, repeat=3):
+    """Run fn() repeat times; return (list of times in seconds, last result)."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return times, result
+
+
+def best_of(fn, repeat=3):
+    """Run fn() repeat times; return (fastest time in seconds, last result)."""
+    times, result = time_runs(fn, repeat)
+    return min(times), result
+
+
+def build_log_db(db_path, n_habits, first_day, n_days, done_rate, seed=42):
+    """Create a throwaway database at db_path with one log per habit per day.
+
+    Habits are named "Habit 0000", "Habit 0001", ...; each log is done
+    with probability done_rate. Days run from first_day for n_days.
+    Returns the number of log rows.
+    """
+    init_db(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        cur = conn.cursor()
+        rng = random.Random(seed)
+        names = [f"Habit {i:04d}" for i in range(n_habits)]
+        ids = get_habit_ids(cur, names)
+        habit_ids = [ids[name] for name in names]
+
+        def rows():
+            for offset in range(n_days):
+                log_date = (first_day + timedelta(days=offset)).strftime("%Y-%m-%d")
+                logged_at = f"{log_date} 20:00:00"
+                for habit_id in habit_ids:
+                    yield habit_id, int(rng.random() < done_rate), logged_at, log_date
+
+        cur.executemany(
+            "INSERT INTO habit_logs (habit_id, done, logged_at, log_date) VALUES (?, ?, ?, ?)",
+            rows(),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return n_habits * n_days